@@ -1,17 +1,24 @@
 """Main X Monitor Agent that orchestrates all components."""
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
+from src import notifiers
 from src.config import Settings
 from src.storage import Storage
 from src.scrapers import XScraper
 from src.analyzers import LLMAnalyzer
-from src.notifiers import EmailNotifier, TelegramNotifier
 from src.models import Account, DailySummary
 
+if TYPE_CHECKING:
+    from src.notifiers import EmailNotifier, TelegramNotifier
+
 
 class XMonitorAgent:
     """Main agent for monitoring X/Twitter accounts."""
@@ -35,14 +42,18 @@ class XMonitorAgent:
             model=settings.openai_model,
             max_completion_tokens=settings.openai_max_completion_tokens,
             temperature=settings.openai_temperature,
+            cache=self.storage,
+            split_by_author=settings.openai_split_by_account,
+            concurrency_limit=settings.openai_concurrency_limit,
         )
 
-        # Initialize notifiers
+        # Initialize notifiers (src.notifiers imports each one on first access,
+        # only when enabled, since they pull in heavy deps)
         self.notifiers: list[EmailNotifier | TelegramNotifier] = []
 
         if settings.email_enabled:
             self.notifiers.append(
-                EmailNotifier(
+                notifiers.EmailNotifier(
                     smtp_host=settings.smtp_host,
                     smtp_port=settings.smtp_port,
                     username=settings.smtp_user,
@@ -54,7 +65,7 @@ class XMonitorAgent:
 
         if settings.telegram_enabled:
             self.notifiers.append(
-                TelegramNotifier(
+                notifiers.TelegramNotifier(
                     bot_token=settings.telegram_bot_token,
                     chat_id=settings.telegram_chat_id,
                 )
@@ -66,6 +77,14 @@ class XMonitorAgent:
         await self.storage.initialize()
         logger.info("X Monitor Agent initialized")
 
+    async def close(self) -> None:
+        """Release network clients and the database connection held by the agent's components."""
+        await self.scraper.close()
+        await self.analyzer.close()
+        for notifier in self.notifiers:
+            await notifier.close()
+        await self.storage.close()
+
     async def add_account(self, username: str) -> Account | None:
         """Add a new account to monitor.
 
@@ -99,6 +118,7 @@ class XMonitorAgent:
     async def remove_account(self, username: str) -> bool:
         """Remove an account from monitoring."""
         username = username.lstrip("@").strip()
+        self.scraper.invalidate_user(username)
         return await self.storage.remove_account(username)
 
     async def list_accounts(self) -> list[Account]:
@@ -108,47 +128,61 @@ class XMonitorAgent:
     async def _ensure_account_info(self, accounts: list[Account]) -> list[Account]:
         """Ensure all accounts have cached user_id. Fetch from API if missing.
 
+        Missing lookups are fetched in batched requests; the results are then
+        written back to the config in a single write.
+
         Returns updated account list with user_id populated.
         """
-        updated = []
-        for account in accounts:
-            if account.user_id:
-                updated.append(account)
-                continue
-
-            # Need to fetch user info from API
-            logger.info(f"Fetching user info for @{account.username} (first time)...")
-            info = await self.scraper.get_user_info(account.username)
-            if info and info.user_id:
-                # Cache to accounts.json
-                await self.storage.update_account_info(
-                    account.username, info.user_id, info.display_name, info.description
-                )
-                account.user_id = info.user_id
-                account.display_name = info.display_name or account.display_name
-                account.description = info.description or account.description
-                logger.info(f"Cached user info for @{account.username} (id={info.user_id})")
-            else:
-                logger.warning(f"Could not fetch user info for @{account.username}, will retry next run")
-            updated.append(account)
-
-        cached_count = sum(1 for a in updated if a.user_id)
-        logger.info(f"Account info: {cached_count}/{len(updated)} have cached user_id")
-        return updated
-
-    async def _build_since_map(self, accounts: list[Account]) -> dict[str, datetime | None]:
-        """Build per-account since times from last saved tweet timestamps."""
+        missing = [account for account in accounts if not account.user_id]
+        if missing:
+            logger.info(f"Fetching user info for {len(missing)} accounts (first time)...")
+            infos = await self.scraper.get_users_info([account.username for account in missing])
+
+            updated: dict[str, Account] = {}
+            for account in missing:
+                info = infos.get(account.username)
+                if info and info.user_id:
+                    updated[account.username] = account.model_copy(
+                        update={
+                            "user_id": info.user_id,
+                            "display_name": info.display_name or account.display_name,
+                            "description": info.description or account.description,
+                        }
+                    )
+                    logger.info(f"Cached user info for @{account.username} (id={info.user_id})")
+                else:
+                    logger.warning(f"Could not fetch user info for @{account.username}, will retry next run")
+
+            # Cache to accounts.json in one write
+            if updated:
+                await self.storage.update_accounts_info([infos[username] for username in updated])
+
+            # Accounts are immutable, so swap in the updated copies
+            accounts = [updated.get(account.username, account) for account in accounts]
+
+        cached_count = sum(1 for a in accounts if a.user_id)
+        logger.info(f"Account info: {cached_count}/{len(accounts)} have cached user_id")
+        return accounts
+
+    async def _build_since_map(
+        self, accounts: list[Account], now: datetime
+    ) -> dict[str, datetime | None]:
+        """Build per-account since times from last saved tweet timestamps.
+
+        Accounts without saved tweets fall back to 24 hours before ``now``.
+        """
         since_map: dict[str, datetime | None] = {}
-        default_since = datetime.now(timezone.utc) - timedelta(days=1)
+        default_since = now - timedelta(days=1)
+        last_times = await self.storage.get_last_tweet_times([a.username for a in accounts])
 
         for account in accounts:
-            last_time = await self.storage.get_last_tweet_time(account.username)
+            last_time = last_times.get(account.username)
             if last_time:
                 since_map[account.username] = last_time
-                logger.debug(f"@{account.username}: incremental since {last_time.strftime('%m-%d %H:%M')}")
+                logger.debug("@{}: incremental since {:%m-%d %H:%M}", account.username, last_time)
             else:
                 since_map[account.username] = default_since
-                logger.debug(f"@{account.username}: first run, since 24h ago")
+                logger.debug("@{}: first run, since 24h ago", account.username)
 
         return since_map
 
@@ -167,6 +201,11 @@ class XMonitorAgent:
         """
         logger.info("Starting daily monitoring job")
 
+        # One clock reading keeps summary date, analysis window and fetch window consistent
+        now = datetime.now(timezone.utc)
+        summary_date = now
+        analysis_since = now - timedelta(days=1)
+
         # Get monitored accounts
         accounts = await self.storage.get_accounts()
         if not accounts:
@@ -179,22 +218,20 @@ class XMonitorAgent:
         accounts = await self._ensure_account_info(accounts)
 
         # Step 2: Build per-account since times for incremental fetch
-        since_map = await self._build_since_map(accounts)
-
-        summary_date = datetime.now(timezone.utc)
+        since_map = await self._build_since_map(accounts, now)
+        since_ids = await self.storage.get_last_tweet_ids([a.username for a in accounts])
 
         # Step 3: Fetch only new tweets
-        new_tweets = await self.scraper.get_tweets_for_accounts(accounts, since_map=since_map)
+        new_tweets = await self.scraper.get_tweets_for_accounts(
+            accounts, since_map=since_map, since_ids=since_ids
+        )
         logger.info(f"Fetched {len(new_tweets)} new tweets from API")
 
-        # Step 4: Save new tweets to local database
+        # Step 4 & 5: Save new tweets to local database, then read all tweets
+        # from last 24h for analysis (one DB round-trip)
+        saved, tweets = await self.storage.save_tweets_and_get_since(new_tweets, analysis_since)
         if new_tweets:
-            saved = await self.storage.save_tweets(new_tweets)
             logger.info(f"Saved {saved} new tweets to database")
-
-        # Step 5: Read all tweets from last 24h for analysis (from local DB)
-        analysis_since = datetime.now(timezone.utc) - timedelta(days=1)
-        tweets = await self.storage.get_tweets_since(analysis_since)
         logger.info(f"Loaded {len(tweets)} tweets from local DB for analysis")
 
         if not tweets:
@@ -217,14 +254,24 @@ class XMonitorAgent:
         self._save_markdown_report(summary)
 
         # Send notifications
-        for notifier in self.notifiers:
-            try:
-                await notifier.send_summary(summary)
-            except Exception as e:
-                logger.error(f"Failed to send notification: {e}")
+        await self._send_notifications(summary)
 
         logger.info("Daily monitoring job completed")
         return summary
+
+    async def _send_notifications(self, summary: DailySummary) -> None:
+        """Send the summary through all enabled notifiers concurrently.
+
+        Notifiers are independent of each other, so e.g. the SMTP handshake
+        overlaps with the Telegram API calls.
+        """
+        results = await asyncio.gather(
+            *(notifier.send_summary(summary) for notifier in self.notifiers),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send notification: {result}")
     
     def _save_markdown_report(self, summary: DailySummary) -> None:
         """Save the daily summary as a Markdown file.
@@ -233,16 +280,15 @@ class XMonitorAgent:
             summary: The daily summary to save
         """
         try:
-            date_str = summary.date.strftime("%Y-%m-%d")
-            filename = self.output_dir / f"report_{date_str}.md"
+            filename = self.output_dir / f"report_{summary.date_key}.md"
             
             # Format report
             report_content = f"""# X/Twitter 每日监控报告
 
-**日期：** {summary.date.strftime("%Y年%m月%d日")}  
+**日期：** {summary.date_display}  
 **监控账号：** {summary.accounts_monitored} 个  
 **推文数量：** {summary.total_tweets} 条  
-**生成时间：** {summary.generated_at.strftime("%Y-%m-%d %H:%M:%S")}
+**生成时间：** {summary.generated_at_display}
 
 ---
 
@@ -252,15 +298,7 @@ class XMonitorAgent:
 
 ## 关键洞察
 
-"""
-            
-            if summary.key_insights:
-                for i, insight in enumerate(summary.key_insights, 1):
-                    report_content += f"{i}. {insight}\n"
-            else:
-                report_content += "（无关键洞察）\n"
-            
-            report_content += f"""
+{summary.insights_text}
 ---
 
 *本报告由 X-Monitor AI Agent 自动生成*
@@ -317,11 +355,9 @@ class XMonitorAgent:
         
         logger.info(f"Loaded {len(tweets)} tweets from database")
         
-        # Get unique authors count
-        authors = set(t.author_username for t in tweets)
-        
-        # Generate analysis with LLM
-        summary = await self.analyzer.analyze_tweets(tweets, date)
+        # Generate analysis with LLM; skip the cache lookup so the analysis is
+        # actually redone (e.g. to replace a truncated one), but cache the result
+        summary = await self.analyzer.analyze_tweets(tweets, date, use_cache=False)
         
         # Save summary to database
         await self.storage.save_summary(summary)
@@ -332,12 +368,26 @@ class XMonitorAgent:
         
         # Send notifications if requested
         if send_notifications:
-            for notifier in self.notifiers:
-                try:
-                    await notifier.send_summary(summary)
-                except Exception as e:
-                    logger.error(f"Failed to send notification: {e}")
+            await self._send_notifications(summary)
             logger.info("Notifications sent")
         
         logger.info(f"Report regeneration completed for {date.strftime('%Y-%m-%d')}")
         return summary
+
+
+@asynccontextmanager
+async def agent_ctx(settings: Settings) -> AsyncIterator[XMonitorAgent]:
+    """Yield an initialized agent and close its clients on exit.
+
+    Args:
+        settings: Application settings
+
+    Yields:
+        The initialized XMonitorAgent
+    """
+    agent = XMonitorAgent(settings)
+    await agent.initialize()
+    try:
+        yield agent
+    finally:
+        await agent.close()
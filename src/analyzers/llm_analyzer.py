@@ -1,10 +1,16 @@
 """LLM-based tweet analyzer using OpenAI."""
 
+import asyncio
+import hashlib
+import re
+from collections import defaultdict
 from datetime import datetime
+
 from loguru import logger
 from openai import AsyncOpenAI
 
 from src.models import Tweet, DailySummary
+from src.storage import Storage
 
 
 SYSTEM_PROMPT = """你是一位资深的 AI 领域分析师和创业顾问，专注于以下领域：
@@ -21,6 +27,109 @@ SYSTEM_PROMPT = """你是一位资深的 AI 领域分析师和创业顾问，专
 
 请使用中文回复。"""
 
+# Tweet count from which prompt formatting is moved off the event loop
+_OFFLOAD_FORMAT_THRESHOLD = 50
+
+# Analysis sections shared by the full-report and synthesis prompts
+ANALYSIS_DIMENSIONS = """### 1. 🔥 今日必看（最重要，放在最前面）
+从所有推文中精选 3-5 条最值得关注的内容，说明：
+- 为什么值得关注
+- 原文链接
+- 建议的行动（学习/实践/收藏/深入研究）
+
+### 2. 📚 LLM 学习与技术实践
+- 有哪些关于大模型、Prompt 工程、Agent 开发的干货？
+- 有什么新工具、新框架、新技术值得学习？
+- 提取可以直接学习或复现的内容
+
+### 3. 💡 AI 创业灵感
+- 发现了哪些 AI 产品创意或商业机会？
+- 有什么可以快速验证的 MVP 想法？
+- 单人/小团队可以做的项目有哪些？
+
+### 4. 💰 AI 赚钱实战
+- 有哪些用 AI 赚钱的真实案例或方法？
+- 有什么可复制的变现模式？
+- 提取具体的数据和收益情况（如有）
+
+### 5. 🎯 关键洞察
+列出 3-5 条最重要的发现，每条包含：
+- 洞察内容
+- 信息来源（哪个账号）
+- 为什么重要"""
+
+# Single-call analysis prompt
+USER_PROMPT_TEMPLATE = """请分析以下 {date_str} 的推文数据，从 AI 学习者和创业者的视角提供深度分析：
+
+## 分析维度
+
+""" + ANALYSIS_DIMENSIONS + """
+
+### 6. 📋 账号动态速览
+简要总结每个活跃账号今天发了什么（1-2句话/账号）
+
+---
+
+推文数据：
+{formatted_tweets}
+
+请确保分析具有可操作性，突出"今日必看"部分。"""
+
+# Per-author prompt used when the analysis is split by author
+AUTHOR_PROMPT_TEMPLATE = """请总结 @{author} 在 {date_str} 的推文，从 AI 学习者和创业者的视角提炼要点：
+- 用 1-2 句话概括该账号今天的动态
+- 列出值得关注的干货、工具、创业灵感或赚钱方法（如有），附原文链接
+- 没有实质内容时简要说明即可
+
+推文数据：
+{formatted_tweets}"""
+
+# Synthesis prompt over the per-author summaries
+SYNTHESIS_PROMPT_TEMPLATE = """以下是 {date_str} 各监控账号的推文要点，请在此基础上从 AI 学习者和创业者的视角提供深度分析：
+
+## 分析维度
+
+""" + ANALYSIS_DIMENSIONS + """
+
+---
+
+各账号要点：
+{account_summaries}
+
+请确保分析具有可操作性，突出"今日必看"部分。"""
+
+# Sections of the analysis whose list items are collected as key insights
+_INSIGHT_SECTION_RE = re.compile(r"今日必看|关键洞察|关键发现|必看")
+_HEADER_RE = re.compile(r"\s*##")
+_BULLET_RE = re.compile(r"\s*[-•*1-5]")
+
+
+def _extract_key_insights(analysis_text: str, limit: int = 5) -> list[str]:
+    """Extract key insights from the "今日必看" / "关键洞察" sections in one pass."""
+    key_insights: list[str] = []
+    in_section = False
+
+    for line in analysis_text.splitlines():
+        # Check if entering a key section
+        if _INSIGHT_SECTION_RE.search(line):
+            in_section = True
+            continue
+        if not in_section:
+            continue
+        # Leave the section at the next header once we have enough from it
+        if _HEADER_RE.match(line):
+            if len(key_insights) >= 3:
+                in_section = False
+            continue
+        if _BULLET_RE.match(line):
+            insight = line.strip().lstrip("-•*0123456789. ")
+            if len(insight) > 10:  # Filter out too short lines
+                key_insights.append(insight)
+                if len(key_insights) >= limit:
+                    break
+
+    return key_insights
+
 
 class LLMAnalyzer:
     """Analyzer using OpenAI for tweet analysis."""
@@ -31,6 +140,9 @@ class LLMAnalyzer:
         model: str = "gpt-4-turbo-preview",
         max_completion_tokens: int = 16000,
         temperature: float | None = None,
+        cache: Storage | None = None,
+        split_by_author: bool = False,
+        concurrency_limit: int = 5,
     ):
         """Initialize the analyzer.
 
@@ -39,163 +151,234 @@ class LLMAnalyzer:
             model: Model name to use
             max_completion_tokens: Maximum tokens for completion
             temperature: Temperature for sampling (None = model default)
+            cache: Storage used to cache analyses (None = no caching)
+            split_by_author: Analyze each author in a separate concurrent call,
+                then synthesize the report from the per-author summaries
+            concurrency_limit: Maximum number of concurrent per-author calls
         """
-        self.client = AsyncOpenAI(api_key=api_key)
         self.model = model
         self.max_completion_tokens = max_completion_tokens
         self.temperature = temperature
+        self.cache = cache
+        self.split_by_author = split_by_author
+        self.concurrency_limit = max(1, concurrency_limit)
+        # The analyzer owns its client: one HTTP connection pool, shared by all
+        # calls (including the concurrent per-author calls) until close()
+        self.client = AsyncOpenAI(api_key=api_key)
 
-    def _format_tweets_for_analysis(self, tweets: list[Tweet]) -> str:
-        """Format tweets into a string for LLM analysis."""
-        if not tweets:
-            return "没有推文数据。"
+    async def close(self) -> None:
+        """Close the analyzer's OpenAI client and its connection pool."""
+        await self.client.close()
 
-        # Group by author
-        by_author: dict[str, list[Tweet]] = {}
-        for tweet in tweets:
-            if tweet.author_username not in by_author:
-                by_author[tweet.author_username] = []
-            by_author[tweet.author_username].append(tweet)
+    def _cache_key(self, tweets: list[Tweet], date: datetime, *prompts: str) -> str:
+        """Build a stable cache key for an analysis request.
+
+        The key covers the model settings, the date, the prompts and the exact
+        set of tweet IDs, so any change to them results in a fresh API call.
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        for part in (
+            self.model,
+            str(self.temperature),
+            date.strftime("%Y%m%d"),
+            SYSTEM_PROMPT,
+            *prompts,
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(b"|".join(sorted(t.tweet_id.encode() for t in tweets)))
+        return digest.hexdigest()
+
+    def _format_author_section(self, author: str, author_tweets: list[Tweet]) -> str:
+        """Format one author's tweets into a prompt section."""
+        display_name = author_tweets[0].author_display_name or author
+        parts = [f"\n## @{author} ({display_name})", f"共 {len(author_tweets)} 条推文\n"]
+        append = parts.append
+
+        for tweet in author_tweets[:10]:  # Limit per author
+            if tweet.is_retweet:
+                prefix = "[转推] "
+            elif tweet.is_reply:
+                prefix = "[回复] "
+            else:
+                prefix = ""
 
-        lines = []
-        for author, author_tweets in by_author.items():
-            display_name = author_tweets[0].author_display_name or author
-            lines.append(f"\n## @{author} ({display_name})")
-            lines.append(f"共 {len(author_tweets)} 条推文\n")
+            # One part per tweet: content line, engagement line and URL line
+            append(
+                f"- [{tweet.created_at:%Y-%m-%d %H:%M}] {prefix}{tweet.content[:200]}\n"
+                f"  ❤️{tweet.likes} 🔁{tweet.retweets} 💬{tweet.replies}\n"
+                f"  {tweet.url}\n"
+            )
 
-            for tweet in author_tweets[:10]:  # Limit per author
-                time_str = tweet.created_at.strftime("%Y-%m-%d %H:%M")
-                engagement = f"❤️{tweet.likes} 🔁{tweet.retweets} 💬{tweet.replies}"
+        return "\n".join(parts)
 
-                prefix = ""
-                if tweet.is_retweet:
-                    prefix = "[转推] "
-                elif tweet.is_reply:
-                    prefix = "[回复] "
+    def _format_author_sections(self, tweets: list[Tweet]) -> dict[str, str]:
+        """Group tweets by author and format one prompt section per author."""
+        by_author: defaultdict[str, list[Tweet]] = defaultdict(list)
+        for tweet in tweets:
+            by_author[tweet.author_username].append(tweet)
 
-                lines.append(f"- [{time_str}] {prefix}{tweet.content[:200]}")
-                lines.append(f"  {engagement}")
-                lines.append(f"  {tweet.url}\n")
+        return {
+            author: self._format_author_section(author, author_tweets)
+            for author, author_tweets in by_author.items()
+        }
 
-        return "\n".join(lines)
+    def _format_tweets_for_analysis(self, tweets: list[Tweet]) -> str:
+        """Format tweets into a string for LLM analysis."""
+        if not tweets:
+            return "没有推文数据。"
+        return "\n".join(self._format_author_sections(tweets).values())
+
+    async def _complete(self, user_prompt: str) -> str:
+        """Run one chat completion and return its text."""
+        # Build request kwargs
+        request_kwargs = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            "max_completion_tokens": self.max_completion_tokens,
+        }
+        # Only add temperature if specified (some models don't support it)
+        if self.temperature is not None:
+            request_kwargs["temperature"] = self.temperature
+
+        response = await self.client.chat.completions.create(**request_kwargs)
+
+        choice = response.choices[0]
+        logger.debug(f"Raw response: {response}")
+        if choice.finish_reason == "length":
+            logger.warning("Analysis was cut off by max_completion_tokens")
+        return choice.message.content or ""
+
+    async def _analyze_by_author(self, author_sections: dict[str, str], date_str: str) -> str:
+        """Analyze each author concurrently, then synthesize the overall report.
+
+        The per-author summaries become the "账号动态速览" section; a final
+        synthesis call over those summaries writes the other sections.
+
+        Raises:
+            RuntimeError: If every per-author call failed (no synthesis is run)
+        """
+        semaphore = asyncio.Semaphore(self.concurrency_limit)
 
-    async def analyze_tweets(self, tweets: list[Tweet], date: datetime) -> DailySummary:
+        async def _analyze_author(author: str, section: str) -> str:
+            prompt = AUTHOR_PROMPT_TEMPLATE.format(
+                author=author, date_str=date_str, formatted_tweets=section
+            )
+            async with semaphore:
+                return await self._complete(prompt)
+
+        results = await asyncio.gather(
+            *(_analyze_author(author, section) for author, section in author_sections.items()),
+            return_exceptions=True,
+        )
+
+        summaries = []
+        succeeded = 0
+        for author, result in zip(author_sections, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error analyzing tweets from @{author}: {result}")
+                text = "（分析生成失败）"
+            else:
+                text = result.strip()
+                succeeded += 1
+            summaries.append(f"**@{author}**\n{text}")
+        if not succeeded:
+            raise RuntimeError("All per-account analyses failed")
+        account_summaries = "\n\n".join(summaries)
+        logger.info(f"Generated {succeeded}/{len(summaries)} per-account summaries")
+
+        overview = await self._complete(
+            SYNTHESIS_PROMPT_TEMPLATE.format(
+                date_str=date_str, account_summaries=account_summaries
+            )
+        )
+        return f"{overview.rstrip()}\n\n### 6. 📋 账号动态速览\n\n{account_summaries}"
+
+    async def analyze_tweets(
+        self, tweets: list[Tweet], date: datetime, use_cache: bool = True
+    ) -> DailySummary:
         """Analyze tweets and generate daily summary.
 
         Args:
             tweets: List of tweets to analyze
             date: The date being summarized
+            use_cache: Reuse a cached analysis of the same input. A new analysis
+                is written to the cache either way.
 
         Returns:
             DailySummary with LLM-generated content
         """
         date_str = date.strftime("%Y年%m月%d日")
-        formatted_tweets = self._format_tweets_for_analysis(tweets)
-
-        # Get unique authors
-        authors = set(t.author_username for t in tweets)
-
-        user_prompt = f"""请分析以下 {date_str} 的推文数据，从 AI 学习者和创业者的视角提供深度分析：
-
-## 分析维度
-
-### 1. 🔥 今日必看（最重要，放在最前面）
-从所有推文中精选 3-5 条最值得关注的内容，说明：
-- 为什么值得关注
-- 原文链接
-- 建议的行动（学习/实践/收藏/深入研究）
-
-### 2. 📚 LLM 学习与技术实践
-- 有哪些关于大模型、Prompt 工程、Agent 开发的干货？
-- 有什么新工具、新框架、新技术值得学习？
-- 提取可以直接学习或复现的内容
-
-### 3. 💡 AI 创业灵感
-- 发现了哪些 AI 产品创意或商业机会？
-- 有什么可以快速验证的 MVP 想法？
-- 单人/小团队可以做的项目有哪些？
-
-### 4. 💰 AI 赚钱实战
-- 有哪些用 AI 赚钱的真实案例或方法？
-- 有什么可复制的变现模式？
-- 提取具体的数据和收益情况（如有）
-
-### 5. 🎯 关键洞察
-列出 3-5 条最重要的发现，每条包含：
-- 洞察内容
-- 信息来源（哪个账号）
-- 为什么重要
-
-### 6. 📋 账号动态速览
-简要总结每个活跃账号今天发了什么（1-2句话/账号）
-
----
-
-推文数据：
-{formatted_tweets}
-
-请确保分析具有可操作性，突出"今日必看"部分。"""
+        # Formatting a large tweet set is pure-CPU string work; do it in a worker
+        # thread so it does not stall other tasks on the event loop
+        if len(tweets) >= _OFFLOAD_FORMAT_THRESHOLD:
+            author_sections = await asyncio.to_thread(self._format_author_sections, tweets)
+        else:
+            author_sections = self._format_author_sections(tweets)
+        formatted_tweets = "\n".join(author_sections.values()) or "没有推文数据。"
+
+        # Sections are keyed by author, so they double as the unique author set
+        accounts_monitored = len(author_sections)
+
+        prompts: tuple[str, ...]
+        if self.split_by_author:
+            prompts = (AUTHOR_PROMPT_TEMPLATE, SYNTHESIS_PROMPT_TEMPLATE, formatted_tweets)
+        else:
+            user_prompt = USER_PROMPT_TEMPLATE.format(
+                date_str=date_str, formatted_tweets=formatted_tweets
+            )
+            prompts = (user_prompt,)
+
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(tweets, date, *prompts)
+            cached = await self.cache.get_llm_cache(cache_key) if use_cache else None
+            if cached:
+                analysis_text, key_insights = cached
+                logger.info(f"Reusing cached analysis for {len(tweets)} tweets")
+                return DailySummary(
+                    date=date,
+                    accounts_monitored=accounts_monitored,
+                    total_tweets=len(tweets),
+                    tweets=tweets,
+                    summary_text=analysis_text,
+                    analysis=analysis_text,
+                    key_insights=key_insights,
+                )
 
         try:
-            # Build request kwargs
-            request_kwargs = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                "max_completion_tokens": self.max_completion_tokens,
-            }
-            # Only add temperature if specified (some models don't support it)
-            if self.temperature is not None:
-                request_kwargs["temperature"] = self.temperature
-
-            response = await self.client.chat.completions.create(**request_kwargs)
-
-            analysis_text = response.choices[0].message.content or ""
+            if self.split_by_author:
+                analysis_text = await self._analyze_by_author(author_sections, date_str)
+            else:
+                analysis_text = await self._complete(user_prompt)
+
             logger.info(f"Generated analysis for {len(tweets)} tweets")
-            logger.debug(f"Raw response: {response}")
             logger.info(f"Analysis text length: {len(analysis_text)}")
 
             # Extract key insights (from "今日必看" or "关键洞察" sections)
-            key_insights = []
-            lines = analysis_text.split("\n")
-            in_section = False
-            section_keywords = ["今日必看", "关键洞察", "关键发现", "必看"]
-
-            for line in lines:
-                # Check if entering a key section
-                if any(kw in line for kw in section_keywords):
-                    in_section = True
-                    continue
-                # Check if leaving the section (new header)
-                if in_section and line.strip().startswith("##"):
-                    if len(key_insights) >= 3:  # Got enough from this section
-                        in_section = False
-                        continue
-                # Extract insights
-                if in_section and line.strip().startswith(("-", "•", "1", "2", "3", "4", "5", "*")):
-                    insight = line.strip().lstrip("-•*0123456789. ")
-                    if insight and len(insight) > 10:  # Filter out too short lines
-                        key_insights.append(insight)
-                if len(key_insights) >= 5:
-                    break
+            key_insights = _extract_key_insights(analysis_text)
+
+            if self.cache is not None and cache_key and analysis_text:
+                await self.cache.set_llm_cache(cache_key, analysis_text, key_insights)
 
             return DailySummary(
                 date=date,
-                accounts_monitored=len(authors),
+                accounts_monitored=accounts_monitored,
                 total_tweets=len(tweets),
                 tweets=tweets,
                 summary_text=analysis_text,
                 analysis=analysis_text,
-                key_insights=key_insights[:5],
+                key_insights=key_insights,
             )
 
         except Exception as e:
             logger.error(f"Error analyzing tweets: {e}")
             return DailySummary(
                 date=date,
-                accounts_monitored=len(authors),
+                accounts_monitored=accounts_monitored,
                 total_tweets=len(tweets),
                 tweets=tweets,
                 summary_text=f"分析生成失败: {e}",
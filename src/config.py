@@ -1,6 +1,7 @@
 """Application configuration using pydantic-settings."""
 
-from pathlib import Path
+from functools import cached_property, lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -21,6 +22,8 @@ class Settings(BaseSettings):
     openai_model: str = "gpt-4-turbo-preview"
     openai_max_completion_tokens: int = 16000
     openai_temperature: float | None = None  # None means use model default
+    openai_split_by_account: bool = False  # One concurrent call per account + synthesis
+    openai_concurrency_limit: int = 5  # Max concurrent per-account calls
 
     # Telegram
     telegram_bot_token: str = ""
@@ -38,24 +41,29 @@ class Settings(BaseSettings):
     summary_cron_minute: int = 0
 
     # Rate limiting (pay-per-use plan)
-    rate_limit_delay: float = 2.0  # Delay between each account (seconds)
-    rate_limit_batch_size: int = 10  # Number of accounts per batch
-    rate_limit_batch_delay: float = 10.0  # Delay between batches (seconds)
+    rate_limit_delay: float = 2.0  # Minimum delay between API requests (seconds)
+    rate_limit_batch_size: int = 10  # Number of requests per batch
+    rate_limit_batch_delay: float = 10.0  # Extra break after each batch (seconds)
 
     # Database
     database_path: str = "data/x_monitor.db"
 
-    @property
+    @cached_property
     def telegram_enabled(self) -> bool:
         """Check if Telegram notifications are configured."""
         return bool(self.telegram_bot_token and self.telegram_chat_id)
 
-    @property
+    @cached_property
     def email_enabled(self) -> bool:
         """Check if email notifications are configured."""
         return bool(self.smtp_user and self.smtp_password and self.email_to)
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings singleton."""
+    """Get application settings singleton.
+
+    The settings (and the .env file) are loaded once per process; call
+    ``get_settings.cache_clear()`` to force a reload.
+    """
     return Settings()
@@ -2,29 +2,65 @@
 
 import asyncio
 import sys
-from pathlib import Path
+from collections.abc import Coroutine
+from types import ModuleType
+from typing import Any
 
 import click
 from loguru import logger
 
+uvloop: ModuleType | None
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 from src.config import get_settings
-from src.agent import XMonitorAgent
+from src.agent import agent_ctx
 from src.schedulers import DailyJobScheduler
 
 
-# Configure logging
-logger.remove()
-logger.add(
-    sys.stderr,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
-    level="INFO",
-)
-logger.add(
-    "logs/x_monitor_{time:YYYY-MM-DD}.log",
-    rotation="1 day",
-    retention="30 days",
-    level="DEBUG",
-)
+def _setup_logging() -> None:
+    """Configure logging sinks.
+
+    Called when a command's body runs (see _run_async) rather than at import
+    or in the group callback, so ``--help`` (including ``<command> --help``)
+    does not create the log directory or open a log file. File writes are enqueued and
+    done by loguru's background thread instead of blocking the event loop.
+    """
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan> - <level>{message}</level>",
+        level="INFO",
+    )
+    logger.add(
+        "logs/x_monitor_{time:YYYY-MM-DD}.log",
+        rotation="1 day",
+        retention="30 days",
+        level="DEBUG",
+        enqueue=True,
+    )
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create the event loop used by CLI commands.
+
+    Uses uvloop when it is installed. On Python 3.12+ the eager task factory is
+    enabled too, so tasks whose coroutines finish without blocking skip the
+    event-loop round-trip.
+    """
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+    return loop
+
+
+def _run_async(ctx: click.Context, coro: Coroutine[Any, Any, None]) -> None:
+    """Set up logging and run a coroutine on the CLI's shared event loop."""
+    _setup_logging()
+    ctx.obj["runner"].run(coro)
 
 
 @click.group()
@@ -33,6 +69,11 @@ def cli(ctx: click.Context) -> None:
     """X Monitor - AI Agent for monitoring X/Twitter accounts."""
     ctx.ensure_object(dict)
     ctx.obj["settings"] = get_settings()
+    # One runner (and event loop) shared by everything the command runs,
+    # closed when the CLI exits
+    runner = asyncio.Runner(loop_factory=_new_event_loop)
+    ctx.call_on_close(runner.close)
+    ctx.obj["runner"] = runner
 
 
 @cli.command()
@@ -42,18 +83,16 @@ def add(ctx: click.Context, username: str) -> None:
     """Add an account to monitor."""
 
     async def _add() -> None:
-        settings = ctx.obj["settings"]
-        agent = XMonitorAgent(settings)
-        await agent.initialize()
+        async with agent_ctx(ctx.obj["settings"]) as agent:
+            account = await agent.add_account(username)
 
-        account = await agent.add_account(username)
         if account:
             click.echo(f"✅ Added @{account.username} ({account.display_name})")
         else:
             click.echo(f"❌ Failed to add @{username}")
             sys.exit(1)
 
-    asyncio.run(_add())
+    _run_async(ctx, _add())
 
 
 @cli.command()
@@ -63,17 +102,16 @@ def remove(ctx: click.Context, username: str) -> None:
     """Remove an account from monitoring."""
 
     async def _remove() -> None:
-        settings = ctx.obj["settings"]
-        agent = XMonitorAgent(settings)
-        await agent.initialize()
+        async with agent_ctx(ctx.obj["settings"]) as agent:
+            removed = await agent.remove_account(username)
 
-        if await agent.remove_account(username):
+        if removed:
             click.echo(f"✅ Removed @{username}")
         else:
             click.echo(f"❌ Account @{username} not found")
             sys.exit(1)
 
-    asyncio.run(_remove())
+    _run_async(ctx, _remove())
 
 
 @cli.command("list")
@@ -82,11 +120,9 @@ def list_accounts(ctx: click.Context) -> None:
     """List all monitored accounts."""
 
     async def _list() -> None:
-        settings = ctx.obj["settings"]
-        agent = XMonitorAgent(settings)
-        await agent.initialize()
+        async with agent_ctx(ctx.obj["settings"]) as agent:
+            accounts = await agent.list_accounts()
 
-        accounts = await agent.list_accounts()
         if not accounts:
             click.echo("No accounts being monitored.")
             return
@@ -98,7 +134,7 @@ def list_accounts(ctx: click.Context) -> None:
                 click.echo(f"    {acc.description[:60]}...")
         click.echo()
 
-    asyncio.run(_list())
+    _run_async(ctx, _list())
 
 
 @cli.command()
@@ -107,12 +143,9 @@ def run(ctx: click.Context) -> None:
     """Run the daily job immediately."""
 
     async def _run() -> None:
-        settings = ctx.obj["settings"]
-        agent = XMonitorAgent(settings)
-        await agent.initialize()
-
-        click.echo("🚀 Running daily monitoring job...")
-        summary = await agent.run_daily_job()
+        async with agent_ctx(ctx.obj["settings"]) as agent:
+            click.echo("🚀 Running daily monitoring job...")
+            summary = await agent.run_daily_job()
 
         if summary:
             click.echo(f"\n✅ Job completed!")
@@ -122,7 +155,7 @@ def run(ctx: click.Context) -> None:
         else:
             click.echo("❌ Job failed or no accounts to monitor")
 
-    asyncio.run(_run())
+    _run_async(ctx, _run())
 
 
 @cli.command()
@@ -132,29 +165,28 @@ def serve(ctx: click.Context) -> None:
 
     async def _serve() -> None:
         settings = ctx.obj["settings"]
-        agent = XMonitorAgent(settings)
-        await agent.initialize()
-
-        scheduler = DailyJobScheduler(
-            hour=settings.summary_cron_hour,
-            minute=settings.summary_cron_minute,
-        )
-        scheduler.set_job(agent.run_daily_job)
-        scheduler.start()
-
-        next_run = scheduler.get_next_run_time()
-        click.echo(f"🚀 X Monitor service started")
-        click.echo(f"⏰ Next scheduled run: {next_run}")
-        click.echo("Press Ctrl+C to stop...")
+        async with agent_ctx(settings) as agent:
+            agent.storage.start_maintenance()
+            scheduler = DailyJobScheduler(
+                hour=settings.summary_cron_hour,
+                minute=settings.summary_cron_minute,
+            )
+            scheduler.set_job(agent.run_daily_job)
+            scheduler.start()
+
+            next_run = scheduler.get_next_run_time()
+            click.echo(f"🚀 X Monitor service started")
+            click.echo(f"⏰ Next scheduled run: {next_run}")
+            click.echo("Press Ctrl+C to stop...")
 
-        try:
-            while True:
-                await asyncio.sleep(3600)
-        except KeyboardInterrupt:
-            scheduler.stop()
-            click.echo("\n👋 Service stopped")
+            try:
+                while True:
+                    await asyncio.sleep(3600)
+            except KeyboardInterrupt:
+                scheduler.stop()
+                click.echo("\n👋 Service stopped")
 
-    asyncio.run(_serve())
+    _run_async(ctx, _serve())
 
 
 @cli.command()
@@ -164,25 +196,22 @@ def history(ctx: click.Context, days: int) -> None:
     """Show recent summary history."""
 
     async def _history() -> None:
-        settings = ctx.obj["settings"]
-        agent = XMonitorAgent(settings)
-        await agent.initialize()
+        async with agent_ctx(ctx.obj["settings"]) as agent:
+            summaries = await agent.get_recent_summaries(days)
 
-        summaries = await agent.get_recent_summaries(days)
         if not summaries:
             click.echo("No summaries found.")
             return
 
         click.echo(f"\n📊 Recent {len(summaries)} summaries:\n")
         for s in summaries:
-            date_str = s.date.strftime("%Y-%m-%d")
-            click.echo(f"  📅 {date_str}")
+            click.echo(f"  📅 {s.date_key}")
             click.echo(f"     Accounts: {s.accounts_monitored}, Tweets: {s.total_tweets}")
             if s.key_insights:
                 click.echo(f"     Key insight: {s.key_insights[0][:60]}...")
             click.echo()
 
-    asyncio.run(_history())
+    _run_async(ctx, _history())
 
 
 @cli.command()
@@ -202,10 +231,6 @@ def regenerate(ctx: click.Context, date: str | None, notify: bool) -> None:
     async def _regenerate() -> None:
         from datetime import datetime, timezone
         
-        settings = ctx.obj["settings"]
-        agent = XMonitorAgent(settings)
-        await agent.initialize()
-
         # Parse date if provided
         target_date = None
         if date:
@@ -218,16 +243,17 @@ def regenerate(ctx: click.Context, date: str | None, notify: bool) -> None:
         date_str = target_date.strftime("%Y-%m-%d") if target_date else "today"
         click.echo(f"🔄 Regenerating report for {date_str} from database...")
         
-        summary = await agent.regenerate_report_from_db(
-            date=target_date,
-            send_notifications=notify
-        )
+        async with agent_ctx(ctx.obj["settings"]) as agent:
+            summary = await agent.regenerate_report_from_db(
+                date=target_date,
+                send_notifications=notify
+            )
 
         if summary:
             click.echo(f"\n✅ Report regenerated!")
-            click.echo(f"   Date: {summary.date.strftime('%Y-%m-%d')}")
+            click.echo(f"   Date: {summary.date_key}")
             click.echo(f"   Tweets analyzed: {summary.total_tweets}")
-            click.echo(f"   Report saved to: output/report_{summary.date.strftime('%Y-%m-%d')}.md")
+            click.echo(f"   Report saved to: output/report_{summary.date_key}.md")
             if notify:
                 click.echo(f"   📧 Notifications sent")
             click.echo(f"\n📊 Analysis preview:\n{summary.analysis[:300]}...")
@@ -235,7 +261,7 @@ def regenerate(ctx: click.Context, date: str | None, notify: bool) -> None:
             click.echo(f"❌ No tweets found in database for {date_str}")
             sys.exit(1)
 
-    asyncio.run(_regenerate())
+    _run_async(ctx, _regenerate())
 
 
 def main() -> None:
@@ -1,22 +1,40 @@
 """Tweet and account data models."""
 
+import sys
 from datetime import datetime
-from pydantic import BaseModel, Field
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+def _local_now() -> datetime:
+    """Current local time as a timezone-aware datetime."""
+    return datetime.now().astimezone()
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern a string that repeats across many model instances."""
+    return sys.intern(value) if value else value
 
 
 class Account(BaseModel):
     """X/Twitter account to monitor."""
 
+    model_config = ConfigDict(frozen=True)
+
     username: str = Field(..., description="Twitter username without @")
     user_id: str | None = Field(default=None, description="Twitter user ID")
     display_name: str | None = Field(default=None, description="Display name")
     description: str | None = Field(default=None, description="Account bio")
-    added_at: datetime = Field(default_factory=datetime.now)
+    added_at: datetime = Field(default_factory=_local_now)
+
+    _intern_username = field_validator("username")(_intern)
 
 
 class Tweet(BaseModel):
     """A single tweet from a monitored account."""
 
+    model_config = ConfigDict(frozen=True)
+
     tweet_id: str = Field(..., description="Unique tweet ID")
     author_username: str = Field(..., description="Author's username")
     author_display_name: str | None = Field(default=None)
@@ -31,15 +49,28 @@ class Tweet(BaseModel):
     is_reply: bool = Field(default=False)
     media_urls: list[str] = Field(default_factory=list)
 
+    # The same few authors appear on many tweets; share one string per author
+    _intern_author = field_validator("author_username", "author_display_name")(_intern)
+
+    # Derived values here and on DailySummary are plain properties rather than
+    # cached_property: model_copy() copies the instance __dict__, so a copy
+    # made with update= would keep the values cached from the original
     @property
     def engagement_score(self) -> int:
         """Calculate engagement score."""
         return self.likes + self.retweets * 2 + self.replies * 3
 
+    @property
+    def created_at_ts(self) -> int:
+        """Creation time as a Unix timestamp, a cheap sort key."""
+        return int(self.created_at.timestamp())
+
 
 class DailySummary(BaseModel):
     """Daily summary of monitored accounts."""
 
+    model_config = ConfigDict(frozen=True)
+
     date: datetime = Field(..., description="Summary date")
     accounts_monitored: int = Field(default=0)
     total_tweets: int = Field(default=0)
@@ -47,4 +78,26 @@ class DailySummary(BaseModel):
     summary_text: str = Field(default="", description="LLM-generated summary")
     analysis: str = Field(default="", description="LLM-generated analysis")
     key_insights: list[str] = Field(default_factory=list)
-    generated_at: datetime = Field(default_factory=datetime.now)
+    generated_at: datetime = Field(default_factory=_local_now)
+
+    @property
+    def date_key(self) -> str:
+        """Summary date as YYYY-MM-DD (storage key and report file name)."""
+        return self.date.strftime("%Y-%m-%d")
+
+    @property
+    def date_display(self) -> str:
+        """Summary date as shown in reports."""
+        return self.date.strftime("%Y年%m月%d日")
+
+    @property
+    def generated_at_display(self) -> str:
+        """Generation time as shown in reports."""
+        return self.generated_at.strftime("%Y-%m-%d %H:%M:%S")
+
+    @property
+    def insights_text(self) -> str:
+        """Numbered key insights, one per line (shared by the Markdown report and the notifiers)."""
+        if not self.key_insights:
+            return "（无关键洞察）\n"
+        return "".join(f"{i}. {insight}\n" for i, insight in enumerate(self.key_insights, 1))
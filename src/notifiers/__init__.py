@@ -1,6 +1,26 @@
 """Notification services for sending summaries."""
 
-from .email_notifier import EmailNotifier
-from .telegram_notifier import TelegramNotifier
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .email_notifier import EmailNotifier
+    from .telegram_notifier import TelegramNotifier
 
 __all__ = ["EmailNotifier", "TelegramNotifier"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import notifiers on first access (PEP 562).
+
+    aiosmtplib and python-telegram-bot are only loaded when a notifier is
+    actually used, which keeps commands that never notify fast to start.
+    """
+    if name == "EmailNotifier":
+        from .email_notifier import EmailNotifier
+
+        return EmailNotifier
+    if name == "TelegramNotifier":
+        from .telegram_notifier import TelegramNotifier
+
+        return TelegramNotifier
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,70 @@
 """Telegram notification service."""
 
+import asyncio
+
 from loguru import logger
 from telegram import Bot
+from telegram.request import HTTPXRequest
 
 from src.models import DailySummary
 
+# Telegram's message length limit, and the chunk size used above it (leaves
+# room for the continuation label)
+MAX_MESSAGE_LENGTH = 4096
+MESSAGE_CHUNK_SIZE = 4000
+# Connections kept for sendMessage (chunks go out one at a time, but several
+# summaries may be sent at once)
+CONNECTION_POOL_SIZE = 8
+
+
+def _split_message(message: str, limit: int = MESSAGE_CHUNK_SIZE) -> list[str]:
+    """Split a message into chunks of at most `limit` chars.
+
+    Walks the message once, breaking each chunk after the last newline within
+    the limit. A single line longer than the limit is split at the limit.
+    """
+    chunks: list[str] = []
+    start = 0
+    end = len(message)
+
+    while end - start > limit:
+        newline = message.rfind("\n", start + 1, start + limit)
+        stop = newline + 1 if newline != -1 else start + limit
+        chunks.append(message[start:stop])
+        start = stop
+
+    if start < end:
+        chunks.append(message[start:])
+    return chunks
+
 
 class TelegramNotifier:
-    """Send notifications via Telegram bot."""
+    """Send notifications via Telegram bot.
+
+    Keeps no per-send state, so send_summary may run concurrently with other
+    notifiers and with itself.
+    """
 
     def __init__(self, bot_token: str, chat_id: str):
-        """Initialize Telegram notifier."""
-        self.bot = Bot(token=bot_token)
+        """Initialize Telegram notifier.
+
+        The notifier owns its Bot and the Bot's HTTP requests, whose connection
+        pools (and TLS connections to the Bot API) are reused across sends
+        until close().
+        """
+        # Bot.shutdown() is a no-op unless Bot.initialize() ran (which calls
+        # getMe), so keep the request objects to shut them down directly
+        self._requests = (
+            HTTPXRequest(connection_pool_size=CONNECTION_POOL_SIZE),
+            HTTPXRequest(connection_pool_size=1),
+        )
+        self.bot = Bot(token=bot_token, request=self._requests[0], get_updates_request=self._requests[1])
         self.chat_id = chat_id
 
+    async def close(self) -> None:
+        """Close the Bot's HTTP connection pools."""
+        await asyncio.gather(*(request.shutdown() for request in self._requests))
+
     async def send_summary(self, summary: DailySummary) -> bool:
         """Send daily summary via Telegram.
 
@@ -25,15 +76,12 @@ class TelegramNotifier:
         """
         try:
             # Build plain text message (no complex escaping needed)
-            date_str = summary.date.strftime("%Y年%m月%d日")
-            gen_time = summary.generated_at.strftime("%Y-%m-%d %H:%M:%S")
-            
             message = f"""📊 X/Twitter 每日监控报告
 
-日期：{date_str}
+日期：{summary.date_display}
 监控账号：{summary.accounts_monitored} 个
 推文数量：{summary.total_tweets} 条
-生成时间：{gen_time}
+生成时间：{summary.generated_at_display}
 
 ━━━━━━━━━━━━━━━
 
@@ -42,48 +90,26 @@ class TelegramNotifier:
 ━━━━━━━━━━━━━━━
 
 关键洞察
-"""
-
-            if summary.key_insights:
-                for i, insight in enumerate(summary.key_insights, 1):
-                    message += f"{i}. {insight}\n"
-            else:
-                message += "（无关键洞察）\n"
-
-            message += f"""
+{summary.insights_text}
 ━━━━━━━━━━━━━━━
 
 本报告由 X-Monitor AI Agent 自动生成
 """
 
             # Split long messages if needed (Telegram max 4096 chars)
-            if len(message) > 4096:
-                # Send in chunks
-                chunks = []
-                current_chunk = ""
-                
-                for line in message.split("\n"):
-                    if len(current_chunk) + len(line) + 1 > 4000:
-                        chunks.append(current_chunk)
-                        current_chunk = line + "\n"
-                    else:
-                        current_chunk += line + "\n"
-                
-                if current_chunk:
-                    chunks.append(current_chunk)
-                
-                for i, chunk in enumerate(chunks):
-                    if i > 0:
-                        chunk = f"📄 (续 {i + 1}/{len(chunks)})\n\n" + chunk
-                    await self.bot.send_message(
-                        chat_id=self.chat_id,
-                        text=chunk,
-                    )
+            if len(message) > MAX_MESSAGE_LENGTH:
+                chunks = _split_message(message)
+                chunks = [
+                    f"📄 (续 {i + 1}/{len(chunks)})\n\n{chunk}" if i > 0 else chunk
+                    for i, chunk in enumerate(chunks)
+                ]
             else:
-                await self.bot.send_message(
-                    chat_id=self.chat_id,
-                    text=message,
-                )
+                chunks = [message]
+
+            # Send chunks one at a time so they arrive in order, and a failed
+            # send stops the rest of the report
+            for chunk in chunks:
+                await self.bot.send_message(chat_id=self.chat_id, text=chunk)
 
             logger.info(f"Telegram message sent to chat {self.chat_id}")
             return True
@@ -51,6 +51,11 @@ class DailyJobScheduler:
             id="daily_summary",
             name="Daily X/Twitter Summary",
             replace_existing=True,
+            # One run per day: never overlap, fold missed runs into one, and
+            # still run if the process was busy or down for up to an hour
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=3600,
         )
 
         self.scheduler.start()
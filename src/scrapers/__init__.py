@@ -1,5 +1,6 @@
 """Scrapers for fetching data from X/Twitter."""
 
+from .rate_limiter import AsyncRateLimiter
 from .x_scraper import XScraper
 
-__all__ = ["XScraper"]
+__all__ = ["AsyncRateLimiter", "XScraper"]
@@ -0,0 +1,68 @@
+"""Async rate limiter for pacing API requests."""
+
+import asyncio
+import time
+from collections import deque
+from types import TracebackType
+from typing import Self
+
+
+class AsyncRateLimiter:
+    """Pace requests issued by concurrent tasks.
+
+    Enforces a minimum interval between consecutive requests and at most
+    ``capacity`` requests within any ``period`` window. Waiters are served in
+    FIFO order, so concurrent callers overlap their waits with in-flight
+    requests instead of each sleeping a fixed delay.
+
+    Usage:
+        async with limiter:
+            await make_request()
+    """
+
+    def __init__(self, capacity: int, interval: float, period: float):
+        """Initialize the limiter.
+
+        Args:
+            capacity: Maximum number of requests per period
+            interval: Minimum delay between consecutive requests (seconds)
+            period: Window length the capacity applies to (seconds)
+        """
+        self.capacity = max(1, capacity)
+        self.interval = interval
+        self.period = period
+        self._timestamps: deque[float] = deque(maxlen=self.capacity)
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause_for(self, seconds: float) -> None:
+        """Hold all requests for `seconds`, e.g. until a rate limit window resets."""
+        deadline = time.monotonic() + seconds
+        self._paused_until = max(self._paused_until, deadline)
+
+    async def acquire(self) -> None:
+        """Wait until the next request may be issued."""
+        async with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            if self._timestamps:
+                wait = self._timestamps[-1] + self.interval - now
+            if len(self._timestamps) == self.capacity:
+                wait = max(wait, self._timestamps[0] + self.period - now)
+            wait = max(wait, self._paused_until - now)
+            if wait > 0:
+                await asyncio.sleep(wait)
+                now = time.monotonic()
+            self._timestamps.append(now)
+
+    async def __aenter__(self) -> Self:
+        await self.acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        return None
@@ -1,16 +1,113 @@
-"""X/Twitter scraper using official XDK."""
+"""X/Twitter scraper using the X API v2 REST endpoints."""
 
 import asyncio
+import heapq
+import time
+from operator import attrgetter
 from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import httpx
+import orjson
 from loguru import logger
-from requests.exceptions import HTTPError
-from xdk import Client
 
 from src.models import Tweet, Account
+from .rate_limiter import AsyncRateLimiter
+
+# X API v2 base URL
+API_BASE_URL = "https://api.x.com/2"
+
+# Fields requested for each tweet
+TWEET_FIELDS = "created_at,public_metrics,referenced_tweets,attachments"
+
+# Fields requested for each user
+USER_FIELDS = "id,name,description,created_at"
+
+# Maximum number of usernames per GET /2/users/by request
+USERS_LOOKUP_BATCH_SIZE = 100
+
+# User info changes rarely, so lookups are cached for a day
+USER_INFO_CACHE_SIZE = 1024
+USER_INFO_CACHE_TTL = 24 * 60 * 60
+
+# Retries after a 429, and the longest wait for a rate limit reset (one X API
+# rate limit window); longer waits skip the request instead
+MAX_RATE_LIMIT_RETRIES = 1
+MAX_RATE_LIMIT_WAIT = 15 * 60
+
+def _format_start_time(since: datetime) -> str:
+    """Format a time as RFC3339 for the start_time parameter (X API requirement)."""
+    return since.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+# Shared empty default for missing tweet fields
+_EMPTY: dict[str, Any] = {}
+
+
+def _build_tweet(
+    tweet: dict[str, Any],
+    username: str,
+    display_name: str | None,
+    media_map: dict[str, str],
+    fetched_at: datetime,
+) -> Tweet:
+    """Build a Tweet from one item of an API timeline response.
+
+    Args:
+        tweet: Tweet object from the response "data" list
+        username: Author's username
+        display_name: Author's display name
+        media_map: Media URLs by media key, from the response "includes"
+        fetched_at: Fallback creation time for tweets without one
+
+    Returns:
+        The Tweet
+    """
+    get = tweet.get
+
+    # Check if retweet or reply. The API returns plain dicts, so subscript
+    # directly and only take the checked path for malformed items
+    refs = get("referenced_tweets") or ()
+    try:
+        ref_types = {ref["type"] for ref in refs}
+    except (TypeError, KeyError):
+        ref_types = {ref.get("type") for ref in refs if isinstance(ref, dict)}
+
+    # Get media URLs
+    attachments = get("attachments")
+    media_keys = (attachments.get("media_keys") or ()) if isinstance(attachments, dict) else ()
+    media_urls = [url for key in media_keys if (url := media_map.get(key)) is not None]
+
+    metric = (get("public_metrics") or _EMPTY).get
+
+    # Parse created_at if it's a string (fromisoformat accepts the "Z" suffix
+    # since Python 3.11)
+    created_at = get("created_at")
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at)
+    elif created_at is None:
+        created_at = fetched_at
+
+    tweet_id = str(get("id"))
+    return Tweet(
+        tweet_id=tweet_id,
+        author_username=username,
+        author_display_name=display_name,
+        content=get("text", ""),
+        created_at=created_at,
+        likes=metric("like_count", 0),
+        retweets=metric("retweet_count", 0),
+        replies=metric("reply_count", 0),
+        views=metric("impression_count"),
+        url=f"https://x.com/{username}/status/{tweet_id}",
+        is_retweet="retweeted" in ref_types,
+        is_reply="replied_to" in ref_types,
+        media_urls=media_urls,
+    )
 
 
 class XScraper:
-    """Scraper for X/Twitter using official API v2 (XDK)."""
+    """Scraper for X/Twitter using official API v2 over an async HTTP client."""
 
     def __init__(
         self,
@@ -23,221 +120,325 @@ class XScraper:
 
         Args:
             bearer_token: X API v2 bearer token
-            rate_limit_delay: Delay between each account request (seconds)
-            rate_limit_batch_size: Number of accounts to process before taking a longer break
-            rate_limit_batch_delay: Delay between batches (seconds)
+            rate_limit_delay: Minimum delay between API requests (seconds)
+            rate_limit_batch_size: Number of requests before taking a longer break
+            rate_limit_batch_delay: Extra break after each batch of requests (seconds)
 
         Note:
-            When rate limit is hit, the scraper will skip the request and continue
-            with the next account instead of retrying.
+            The X API rate limit headers drive extra pauses: when a window is
+            exhausted, all requests wait for its reset. A rate-limited request is
+            retried once after the reset if that is within MAX_RATE_LIMIT_WAIT,
+            otherwise it is skipped and the scraper continues with the next account.
         """
-        self.client = Client(bearer_token=bearer_token)
+        self._bearer_token = bearer_token
+        self._client: httpx.AsyncClient | None = None
         self.rate_limit_delay = rate_limit_delay
         self.rate_limit_batch_size = rate_limit_batch_size
         self.rate_limit_batch_delay = rate_limit_batch_delay
         self._request_count = 0
+        # username -> (user_id, display_name), so each user is looked up once
+        self._user_cache: dict[str, tuple[str, str | None]] = {}
+        # username -> (expiry, Account) for get_user_info / get_users_info
+        self._user_info_cache: dict[str, tuple[float, Account]] = {}
+        # Pace requests like fixed sleeps would (a delay between requests plus a
+        # break after each batch), but measured from request start so waits
+        # overlap with request latency and with other concurrent requests.
+        self._limiter = AsyncRateLimiter(
+            capacity=rate_limit_batch_size,
+            interval=rate_limit_delay,
+            period=rate_limit_batch_size * rate_limit_delay + rate_limit_batch_delay,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The HTTP client, created on first use.
 
-    async def _execute_with_retry(self, func, *args, **kwargs):
-        """Execute a function and skip on rate limit errors.
+        One pooled client serves all requests, so concurrent fetches reuse
+        keep-alive connections to the API. The pool is sized to the number
+        of concurrent fetches. Commands that never call the API skip the
+        client (and its SSL context) setup entirely.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=API_BASE_URL,
+                headers={"Authorization": f"Bearer {self._bearer_token}"},
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=self.rate_limit_batch_size,
+                    max_keepalive_connections=self.rate_limit_batch_size,
+                ),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the HTTP client and its connection pool, if it was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        """Make a GET request to the X API, pacing it by the rate limit headers.
 
         Args:
-            func: The function to execute
-            *args, **kwargs: Arguments to pass to the function
+            path: Endpoint path relative to the API base URL
+            params: Query parameters
 
         Returns:
-            The result of the function call, or None if rate limited
+            The decoded JSON response, or None if rate limited (or the server
+            failed) and the request was skipped
         """
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            async with self._limiter:
+                self._request_count += 1
+            response = await self.client.get(path, params=params)
+            reset_in = self._rate_limit_reset_in(response)
+
+            if response.status_code != 429:
+                break
+            if attempt < MAX_RATE_LIMIT_RETRIES and reset_in is not None:
+                logger.warning(f"⚠️  Rate limit hit for {path}, retrying after reset in {reset_in:.0f}s")
+                self._limiter.pause_for(reset_in)
+                continue
+            logger.warning(
+                f"⚠️  Rate limit hit! Skipping this request to continue processing. "
+                f"Path: {path}"
+            )
+            return None
+
+        # Window exhausted: hold every request until it resets instead of
+        # running into 429s
+        if reset_in is not None and response.headers.get("x-rate-limit-remaining") == "0":
+            logger.info(f"Rate limit window exhausted, pausing requests for {reset_in:.0f}s")
+            self._limiter.pause_for(reset_in)
+
+        status = response.status_code
+        if status >= 500:
+            logger.warning(f"X API server error ({status}) for {path}. Skipping this request.")
+            return None
+        if status >= 400:
+            logger.error(f"HTTP error ({status}) for {path}: {response.text}")
+            response.raise_for_status()
+        body: dict[str, Any] = orjson.loads(response.content)
+        return body
+
+    @staticmethod
+    def _rate_limit_reset_in(response: httpx.Response) -> float | None:
+        """Seconds until the rate limit window resets, from the response headers.
+
+        Returns None when the header is missing or the reset is further away
+        than MAX_RATE_LIMIT_WAIT.
+        """
+        reset = response.headers.get("x-rate-limit-reset")
+        if reset is None:
+            return None
         try:
-            self._request_count += 1
-            result = func(*args, **kwargs)
-            return result
-        except HTTPError as e:
-            status = e.response.status_code if e.response is not None else None
-            if status == 429:
-                logger.warning(
-                    f"⚠️  Rate limit hit! Skipping this request to continue processing. "
-                    f"Error: {e}"
-                )
-                return None
-            elif status is not None and status >= 500:
-                logger.warning(
-                    f"X API server error ({status}): {e}. Skipping this request."
-                )
-                return None
-            else:
-                logger.error(f"HTTP error ({status}): {e}")
-                raise
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            raise
+            reset_in = max(0.0, float(reset) - time.time())
+        except ValueError:
+            return None
+        return reset_in if reset_in <= MAX_RATE_LIMIT_WAIT else None
+
+    def _cached_user_info(self, username: str) -> Account | None:
+        """Return cached user info if it has not expired."""
+        cached = self._user_info_cache.get(username)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def _remember_user(self, account: Account) -> None:
+        """Cache a looked-up user's ID and info."""
+        username = account.username
+        if account.user_id is not None:
+            self._user_cache[username] = (account.user_id, account.display_name)
+        if username not in self._user_info_cache and len(self._user_info_cache) >= USER_INFO_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._user_info_cache.pop(next(iter(self._user_info_cache)))
+        self._user_info_cache[username] = (time.monotonic() + USER_INFO_CACHE_TTL, account)
+
+    def invalidate_user(self, username: str) -> None:
+        """Forget cached user ID and info for a username."""
+        self._user_cache.pop(username, None)
+        self._user_info_cache.pop(username, None)
 
     async def get_user_info(self, username: str) -> Account | None:
-        """Fetch user information by username."""
+        """Fetch user information by username.
+
+        Results are cached for USER_INFO_CACHE_TTL seconds.
+        """
+        cached = self._cached_user_info(username)
+        if cached:
+            return cached
         try:
-            response = await self._execute_with_retry(
-                self.client.users.get_by_username,
-                username=username,
-                user_fields=["id", "name", "description", "created_at"],
+            body = await self._request(
+                f"/users/by/username/{username}",
+                {"user.fields": USER_FIELDS},
             )
-            if not response:
+            if body is None:
                 logger.warning(f"Skipped fetching user info for {username} due to rate limit")
                 return None
-            data = response.data
+            data = body.get("data")
             if data:
-                return Account(
+                account = Account(
                     username=username,
                     user_id=str(data['id']),
                     display_name=data.get('name'),
                     description=data.get('description'),
                 )
+                self._remember_user(account)
+                return account
             return None
         except Exception as e:
             logger.error(f"Error fetching user {username}: {e}")
             return None
 
+    async def get_users_info(self, usernames: list[str]) -> dict[str, Account]:
+        """Fetch user information for many usernames in batched requests.
+
+        Resolves up to USERS_LOOKUP_BATCH_SIZE usernames per GET /2/users/by
+        request instead of one request per user. Cached users (see
+        get_user_info) are not looked up again.
+
+        Args:
+            usernames: Twitter usernames without @
+
+        Returns:
+            Accounts keyed by the requested username; users that were not found
+            (or whose batch failed) are missing
+        """
+        accounts: dict[str, Account] = {}
+        uncached: list[str] = []
+        for username in usernames:
+            cached = self._cached_user_info(username)
+            if cached:
+                accounts[username] = cached
+            else:
+                uncached.append(username)
+        usernames = uncached
+
+        for start in range(0, len(usernames), USERS_LOOKUP_BATCH_SIZE):
+            batch = usernames[start:start + USERS_LOOKUP_BATCH_SIZE]
+            try:
+                body = await self._request(
+                    "/users/by",
+                    {"usernames": ",".join(batch), "user.fields": USER_FIELDS},
+                )
+            except Exception as e:
+                logger.error(f"Error fetching users {', '.join(batch)}: {e}")
+                continue
+            if body is None:
+                logger.warning(f"Skipped fetching user info for {len(batch)} users due to rate limit")
+                continue
+
+            # The API returns usernames in their canonical case
+            requested = {username.lower(): username for username in batch}
+            for data in body.get("data") or []:
+                requested_name = requested.get(str(data.get("username", "")).lower())
+                if requested_name is None:
+                    continue
+                account = Account(
+                    username=requested_name,
+                    user_id=str(data['id']),
+                    display_name=data.get('name'),
+                    description=data.get('description'),
+                )
+                self._remember_user(account)
+                accounts[requested_name] = account
+        return accounts
+
     async def get_recent_tweets(
         self,
         username: str,
-        since: datetime | None = None,
+        since: datetime,
         max_results: int = 100,
         user_id: str | None = None,
         display_name: str | None = None,
+        since_str: str | None = None,
+        since_id: str | None = None,
     ) -> list[Tweet]:
         """Fetch recent tweets from a user.
 
         Args:
             username: Twitter username without @
-            since: Fetch tweets after this time (default: 24 hours ago)
+            since: Fetch tweets after this time
             max_results: Maximum number of tweets to fetch
             user_id: Cached user ID (skips API lookup if provided)
             display_name: Cached display name
+            since_str: Pre-formatted start_time (takes precedence over since)
+            since_id: Only fetch tweets newer than this tweet ID (e.g. the
+                newest one already stored)
 
         Returns:
             List of Tweet objects
         """
-        if since is None:
-            since = datetime.now(timezone.utc) - timedelta(days=1)
+        if since_str is None:
+            since_str = _format_start_time(since)
 
         tweets: list[Tweet] = []
 
         try:
             # Use cached user_id if available, otherwise fetch from API
+            if not user_id and username in self._user_cache:
+                user_id, cached_name = self._user_cache[username]
+                display_name = display_name or cached_name
+
             if not user_id:
-                user_response = await self._execute_with_retry(
-                    self.client.users.get_by_username, username=username
-                )
-                if not user_response or not user_response.data:
-                    if not user_response:
+                user_body = await self._request(f"/users/by/username/{username}")
+                if not user_body or not user_body.get("data"):
+                    if user_body is None:
                         logger.warning(f"Skipped fetching user {username} due to rate limit")
                     else:
                         logger.warning(f"User not found: {username}")
                     return tweets
 
-                user_id = user_response.data['id']
-                display_name = user_response.data.get('name', username)
-
-                # Small delay between getting user and getting tweets
-                await asyncio.sleep(1)
-
-            # Fetch tweets - format time as RFC3339 (X API requirement)
-            start_time_str = since.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-            # Get user tweets (using XDK's users.get_posts - returns a generator)
-            posts_iter = await self._execute_with_retry(
-                self.client.users.get_posts,
-                id=user_id,
-                start_time=start_time_str,
-                max_results=min(max_results, 100),
-                tweet_fields=[
-                    "created_at",
-                    "public_metrics",
-                    "referenced_tweets",
-                    "attachments",
-                ],
-                expansions=["attachments.media_keys"],
-                media_fields=["url", "preview_image_url"],
-            )
-
-            if not posts_iter:
+                user_id = user_body["data"]['id']
+                display_name = user_body["data"].get('name', username)
+                self._user_cache[username] = (user_id, display_name)
+
+            # Get the first page of user tweets
+            params: dict[str, Any] = {
+                "start_time": since_str,
+                "max_results": min(max_results, 100),
+                "tweet.fields": TWEET_FIELDS,
+                "expansions": "attachments.media_keys",
+                "media.fields": "url,preview_image_url",
+            }
+            if since_id:
+                params["since_id"] = since_id
+            response = await self._request(f"/users/{user_id}/tweets", params)
+
+            if response is None:
                 logger.warning(f"Skipped fetching tweets from {username} due to rate limit")
                 return tweets
 
-            # Get first page from generator
-            try:
-                response = next(posts_iter, None)
-            except StopIteration:
-                response = None
-            
-            if not response or not response.data:
-                logger.info(f"No recent tweets from {username}")
+            if not response.get("data"):
+                logger.info("No recent tweets from {}", username)
                 return tweets
 
-            # Process media
-            media_map = {}
-            includes = getattr(response, "includes", None)
-            if includes and isinstance(includes, dict):
-                media_list = includes.get("media", [])
-                for media in media_list:
-                    if isinstance(media, dict):
-                        media_key = media.get("media_key")
-                        media_url = media.get("url") or media.get("preview_image_url")
-                        if media_key and media_url:
-                            media_map[media_key] = media_url
-
-            for tweet in response.data:
-                # XDK returns tweets as dicts
-                if not isinstance(tweet, dict):
-                    continue
-                
-                # Check if retweet or reply
-                is_retweet = False
-                is_reply = False
-                referenced_tweets = tweet.get("referenced_tweets", [])
-                if referenced_tweets:
-                    for ref in referenced_tweets:
-                        ref_type = ref.get("type") if isinstance(ref, dict) else getattr(ref, "type", None)
-                        if ref_type == "retweeted":
-                            is_retweet = True
-                        elif ref_type == "replied_to":
-                            is_reply = True
-
-                # Get media URLs
-                media_urls = []
-                attachments = tweet.get("attachments")
-                if attachments and isinstance(attachments, dict):
-                    media_keys = attachments.get("media_keys", [])
-                    for key in media_keys:
-                        if key in media_map:
-                            media_urls.append(media_map[key])
-
-                metrics = tweet.get("public_metrics", {})
-
-                # Parse created_at if it's a string
-                created_at = tweet.get("created_at")
-                if isinstance(created_at, str):
-                    created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                elif created_at is None:
-                    created_at = datetime.now(timezone.utc)
-
-                tweets.append(
-                    Tweet(
-                        tweet_id=str(tweet.get("id")),
-                        author_username=username,
-                        author_display_name=display_name,
-                        content=tweet.get("text", ""),
-                        created_at=created_at,
-                        likes=metrics.get("like_count", 0) if metrics else 0,
-                        retweets=metrics.get("retweet_count", 0) if metrics else 0,
-                        replies=metrics.get("reply_count", 0) if metrics else 0,
-                        views=metrics.get("impression_count") if metrics else None,
-                        url=f"https://x.com/{username}/status/{tweet.get('id')}",
-                        is_retweet=is_retweet,
-                        is_reply=is_reply,
-                        media_urls=media_urls,
-                    )
-                )
-
-            logger.info(f"Fetched {len(tweets)} tweets from {username}")
+            # Process media: media key -> URL, keeping only media with a URL
+            includes = response.get("includes")
+            media_items = (includes.get("media") or ()) if isinstance(includes, dict) else ()
+            try:
+                media_map = {
+                    media["media_key"]: media_url
+                    for media in media_items
+                    if (media_url := media.get("url") or media.get("preview_image_url"))
+                }
+            except (TypeError, KeyError, AttributeError):
+                media_map = {
+                    media_key: media_url
+                    for media in media_items
+                    if isinstance(media, dict)
+                    and (media_key := media.get("media_key"))
+                    and (media_url := media.get("url") or media.get("preview_image_url"))
+                }
+
+            fetched_at = datetime.now(timezone.utc)
+            tweets = [
+                _build_tweet(tweet, username, display_name, media_map, fetched_at)
+                for tweet in response["data"]
+                if isinstance(tweet, dict)
+            ]
+
+            logger.info("Fetched {} tweets from {}", len(tweets), username)
 
         except Exception as e:
             logger.error(f"Error fetching tweets from {username}: {e}")
@@ -248,23 +449,28 @@ class XScraper:
         self,
         accounts: list[Account],
         since_map: dict[str, datetime | None] | None = None,
+        since_ids: dict[str, str] | None = None,
     ) -> list[Tweet]:
         """Fetch tweets from multiple accounts with rate limiting.
 
-        Uses cached user_id from Account objects to skip API lookups.
-        Uses per-account since times for incremental fetching.
+        Accounts are fetched by a pool of rate_limit_batch_size concurrent
+        workers; the shared rate limiter paces the actual API requests.
+        Uses cached user_id from Account objects to skip API lookups; the
+        remaining user IDs are resolved up front in batched lookups.
+        Uses per-account since times and since IDs for incremental fetching.
 
         Args:
             accounts: List of accounts to fetch tweets from (with cached user_id)
             since_map: Per-account since times {username: datetime}. Falls back to 24h ago.
+            since_ids: Per-account newest already-seen tweet IDs {username: tweet_id}
 
         Returns:
             List of all tweets sorted by creation time (newest first)
         """
-        all_tweets: list[Tweet] = []
         total_accounts = len(accounts)
         self._request_count = 0
         since_map = since_map or {}
+        since_ids = since_ids or {}
 
         logger.info(
             f"Starting to fetch tweets from {total_accounts} accounts "
@@ -273,50 +479,81 @@ class XScraper:
             f"batch delay: {self.rate_limit_batch_delay}s)"
         )
 
-        for i, account in enumerate(accounts):
-            account_num = i + 1
-
-            # Check if we need a batch delay
-            if i > 0 and i % self.rate_limit_batch_size == 0:
-                logger.info(
-                    f"Completed batch of {self.rate_limit_batch_size} accounts. "
-                    f"Taking a {self.rate_limit_batch_delay:.0f}s break to avoid rate limits..."
-                )
-                await asyncio.sleep(self.rate_limit_batch_delay)
-
-            since = since_map.get(account.username)
-            since_label = since.strftime("%m-%d %H:%M") if since else "24h ago"
-            logger.info(
-                f"[{account_num}/{total_accounts}] Fetching tweets from @{account.username} (since {since_label})..."
-            )
-
-            try:
-                tweets = await self.get_recent_tweets(
-                    account.username,
-                    since=since,
-                    user_id=account.user_id,
-                    display_name=account.display_name,
-                )
-                all_tweets.extend(tweets)
+        unresolved = [
+            account.username
+            for account in accounts
+            if not account.user_id and account.username not in self._user_cache
+        ]
+        if unresolved:
+            logger.info(f"Resolving user IDs for {len(unresolved)} accounts...")
+            await self.get_users_info(unresolved)
+
+        # One 24h default for the whole batch, and each start time formatted
+        # once per batch rather than once per account
+        default_since = datetime.now(timezone.utc) - timedelta(days=1)
+        since_strs = {
+            since: _format_start_time(since)
+            for since in {default_since, *since_map.values()}
+            if since
+        }
+
+        # A fixed pool of workers drains a queue of accounts, so at most
+        # rate_limit_batch_size fetches are in flight at any time
+        queue: asyncio.Queue[tuple[int, Account]] = asyncio.Queue()
+        for item in enumerate(accounts, 1):
+            queue.put_nowait(item)
+        results: list[list[Tweet]] = [[] for _ in accounts]
+
+        async def _worker() -> None:
+            while not queue.empty():
+                account_num, account = queue.get_nowait()
+                since = since_map.get(account.username)
+                # Per-account lines pass arguments instead of f-strings, so
+                # loguru only formats them when the level is enabled
+                if since:
+                    logger.info(
+                        "[{}/{}] Fetching tweets from @{} (since {:%m-%d %H:%M})...",
+                        account_num, total_accounts, account.username, since,
+                    )
+                else:
+                    logger.info(
+                        "[{}/{}] Fetching tweets from @{} (since 24h ago)...",
+                        account_num, total_accounts, account.username,
+                    )
+                    since = default_since
+                try:
+                    tweets = await self.get_recent_tweets(
+                        account.username,
+                        since=since,
+                        user_id=account.user_id,
+                        display_name=account.display_name,
+                        since_str=since_strs[since],
+                        since_id=since_ids.get(account.username),
+                    )
+                except Exception as e:
+                    # Continue with other accounts instead of failing completely
+                    logger.error(
+                        f"[{account_num}/{total_accounts}] Failed to fetch tweets from @{account.username}: {e}"
+                    )
+                    continue
                 logger.info(
-                    f"[{account_num}/{total_accounts}] Got {len(tweets)} tweets from @{account.username}"
-                )
-            except Exception as e:
-                logger.error(
-                    f"[{account_num}/{total_accounts}] Failed to fetch tweets from @{account.username}: {e}"
+                    "[{}/{}] Got {} tweets from @{}",
+                    account_num, total_accounts, len(tweets), account.username,
                 )
-                # Continue with next account instead of failing completely
+                results[account_num - 1] = tweets
 
-            # Delay before next account (except for the last one)
-            if account_num < total_accounts:
-                logger.debug(f"Waiting {self.rate_limit_delay}s before next request...")
-                await asyncio.sleep(self.rate_limit_delay)
+        workers = min(self.rate_limit_batch_size, total_accounts)
+        await asyncio.gather(*(_worker() for _ in range(workers)))
 
+        per_account_tweets = [tweets for tweets in results if tweets]
+        total_tweets = sum(len(tweets) for tweets in per_account_tweets)
         logger.info(
-            f"Completed fetching tweets. Total: {len(all_tweets)} tweets from {total_accounts} accounts. "
+            f"Completed fetching tweets. Total: {total_tweets} tweets from {total_accounts} accounts. "
             f"API requests made: {self._request_count}"
         )
 
-        # Sort by creation time, newest first
-        all_tweets.sort(key=lambda t: t.created_at, reverse=True)
-        return all_tweets
+        # The API returns each user's tweets newest first, so merge the
+        # per-account lists instead of sorting everything again
+        return list(
+            heapq.merge(*per_account_tweets, key=attrgetter("created_at_ts"), reverse=True)
+        )
@@ -1,14 +1,218 @@
 """Storage layer using SQLite for persistence."""
 
-import json
-from datetime import datetime, timezone
+import asyncio
+import contextlib
+import copy
+import os
+import sqlite3
+import time
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, TypeAlias
 
 import aiosqlite
+import orjson
 from loguru import logger
 
 from src.models import Account, Tweet, DailySummary
 
+# Per-username account lookups are cached briefly in a small LRU; writes through
+# Storage invalidate the cache immediately, the TTL bounds staleness from manual
+# edits
+ACCOUNT_CACHE_SIZE = 32
+ACCOUNT_CACHE_TTL = 60.0
+
+# Rows fetched per batch when streaming tweets from the database
+TWEET_FETCH_SIZE = 256
+
+# Seconds between PRAGMA optimize runs on the long-lived connection
+MAINTENANCE_INTERVAL = 15 * 60
+
+# Cached LLM analyses older than this are pruned during maintenance
+LLM_CACHE_MAX_AGE = timedelta(days=7)
+
+
+# Stored in PRAGMA user_version; initialize() migrates older databases
+# 1: tweets.created_at and summaries.generated_at are REAL epoch seconds
+# 2: tweets.created_at, tweets.fetched_at and summaries.generated_at are
+#    INTEGER epoch microseconds
+# 3: tweets.is_retweet and tweets.is_reply are packed into tweets.flags
+SCHEMA_VERSION = 3
+
+# Bits of tweets.flags
+TWEET_FLAG_RETWEET = 1
+TWEET_FLAG_REPLY = 2
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS summaries (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date TEXT NOT NULL UNIQUE,
+        accounts_monitored INTEGER,
+        total_tweets INTEGER,
+        summary_text TEXT,
+        analysis TEXT,
+        key_insights TEXT,
+        generated_at INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_summaries_date ON summaries(date)",
+    """
+    CREATE TABLE IF NOT EXISTS tweets (
+        tweet_id TEXT PRIMARY KEY,
+        author_username TEXT NOT NULL,
+        author_display_name TEXT,
+        content TEXT,
+        created_at INTEGER NOT NULL,
+        likes INTEGER DEFAULT 0,
+        retweets INTEGER DEFAULT 0,
+        replies INTEGER DEFAULT 0,
+        views INTEGER,
+        url TEXT,
+        flags INTEGER DEFAULT 0,
+        media_urls TEXT,
+        fetched_at INTEGER NOT NULL
+    )
+    """,
+    # Per-author lookups (MAX(created_at), newest-first ranges) are answered
+    # from this index; it replaces the old author-only index
+    "CREATE INDEX IF NOT EXISTS idx_tweets_author_created ON tweets(author_username, created_at DESC)",
+    "DROP INDEX IF EXISTS idx_tweets_author",
+    "CREATE INDEX IF NOT EXISTS idx_tweets_created ON tweets(created_at)",
+    """
+    CREATE TABLE IF NOT EXISTS llm_cache (
+        key TEXT PRIMARY KEY,
+        analysis TEXT NOT NULL,
+        key_insights TEXT,
+        created_at TEXT NOT NULL
+    )
+    """,
+)
+
+# A result row. No row_factory is set, so rows are plain tuples at runtime;
+# aiosqlite annotates its results as sqlite3.Row, hence the union
+DbRow: TypeAlias = tuple[Any, ...] | sqlite3.Row
+
+# Selected explicitly and unpacked positionally by _row_to_tweet() and
+# _row_to_summary(); keep the orders in sync
+TWEET_COLUMNS = (
+    "tweet_id, author_username, author_display_name, content, created_at, "
+    "likes, retweets, replies, views, url, flags, media_urls"
+)
+SUMMARY_COLUMNS = (
+    "id, date, accounts_monitored, total_tweets, summary_text, analysis, key_insights, generated_at"
+)
+
+# Statements run on every job, built once; sqlite3 reuses the prepared
+# statement for identical SQL text on the same connection
+INSERT_TWEETS_SQL = (
+    f"INSERT OR IGNORE INTO tweets ({TWEET_COLUMNS}, fetched_at) VALUES ({', '.join('?' * 13)})"
+)
+SELECT_TWEETS_SINCE_SQL = (
+    f"SELECT {TWEET_COLUMNS} FROM tweets WHERE created_at >= ? ORDER BY created_at DESC"
+)
+SELECT_USER_TWEETS_SINCE_SQL = (
+    f"SELECT {TWEET_COLUMNS} FROM tweets WHERE created_at >= ? AND author_username = ? "
+    "ORDER BY created_at DESC"
+)
+SELECT_TWEETS_BETWEEN_SQL = (
+    f"SELECT {TWEET_COLUMNS} FROM tweets WHERE created_at >= ? AND created_at <= ? "
+    "ORDER BY created_at DESC"
+)
+SELECT_USER_TWEETS_BETWEEN_SQL = (
+    f"SELECT {TWEET_COLUMNS} FROM tweets WHERE created_at >= ? AND created_at <= ? "
+    "AND author_username = ? ORDER BY created_at DESC"
+)
+UPSERT_SUMMARY_SQL = """
+    INSERT INTO summaries
+    (date, accounts_monitored, total_tweets, summary_text, analysis, key_insights, generated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        accounts_monitored = excluded.accounts_monitored,
+        total_tweets = excluded.total_tweets,
+        summary_text = excluded.summary_text,
+        analysis = excluded.analysis,
+        key_insights = excluded.key_insights,
+        generated_at = excluded.generated_at
+"""
+SELECT_SUMMARY_SQL = f"SELECT {SUMMARY_COLUMNS} FROM summaries WHERE date = ?"
+SELECT_RECENT_SUMMARIES_SQL = f"SELECT {SUMMARY_COLUMNS} FROM summaries ORDER BY date DESC LIMIT ?"
+
+# Size of each connection's prepared statement cache
+STATEMENT_CACHE_SIZE = 256
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_micros(value: datetime) -> int:
+    """Convert a datetime to integer epoch microseconds.
+
+    Naive datetimes are taken as UTC, matching how the stored ISO strings
+    compared before timestamps became numbers.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return round(value.timestamp() * 1_000_000)
+
+
+def _from_micros(value: int) -> datetime:
+    """Convert integer epoch microseconds to an aware UTC datetime, exactly."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _iso_to_micros(value: str) -> int:
+    """Convert an ISO 8601 timestamp (as stored by version 0) to epoch microseconds."""
+    return _to_micros(datetime.fromisoformat(value))
+
+
+def _local_iso_to_micros(value: str) -> int:
+    """Convert an ISO 8601 timestamp to epoch microseconds, naive values as local time.
+
+    Version 0 saved summaries.generated_at from a naive datetime.now(), unlike
+    the tweet timestamps, which always carried an offset.
+    """
+    return _to_micros(datetime.fromisoformat(value).astimezone())
+
+
+def _seconds_to_micros(value: float) -> int:
+    """Convert REAL epoch seconds (as stored by version 1) to epoch microseconds."""
+    return round(value * 1_000_000)
+
+
+def _tweet_flags(is_retweet: bool, is_reply: bool) -> int:
+    """Pack a tweet's boolean attributes into the tweets.flags bitfield."""
+    return (TWEET_FLAG_RETWEET if is_retweet else 0) | (TWEET_FLAG_REPLY if is_reply else 0)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(value: str) -> datetime:
+    """Parse a summary date key ("%Y-%m-%d") to midnight; the same few dates are read repeatedly."""
+    return datetime.fromisoformat(value)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so that readers see either the old or the new contents.
+
+    The data goes to a temporary file next to the target, is fsynced and then
+    renamed over the target; a crash mid-write leaves the old file intact.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    if os.name == "posix":
+        # Persist the rename itself
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
 
 class Storage:
     """Storage for accounts (JSON file), tweets and summaries (SQLite)."""
@@ -20,190 +224,476 @@ class Storage:
         self.accounts_config_path = Path(accounts_config_path)
         # Ensure config directory exists
         self.accounts_config_path.parent.mkdir(parents=True, exist_ok=True)
+        # username -> (expires_at, account or None)
+        self._account_cache: dict[str, tuple[float, Account | None]] = {}
+        # (expires_at, all accounts) for get_accounts
+        self._accounts_cache: tuple[float, list[Account]] | None = None
+        # (st_mtime_ns, st_size, parsed config) of the accounts file, and its
+        # entries by username
+        self._config_cache: tuple[int, int, dict[str, Any]] | None = None
+        self._username_index: dict[str, dict[str, Any]] = {}
+        # One connection for the lifetime of the storage; writes (including
+        # their commit) are serialized so transactions don't interleave
+        self._db: aiosqlite.Connection | None = None
+        # Reads go through a second, read-only connection; under WAL they
+        # don't wait for the writer's transactions
+        self._read_db: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        # Serializes read-modify-write cycles of the accounts config
+        self._config_lock = asyncio.Lock()
+        self._maintenance_task: asyncio.Task[None] | None = None
+
+    async def _get_db(self) -> aiosqlite.Connection:
+        """Return the shared database connection, opening it on first use."""
+        if self._db is None:
+            # Rows are plain tuples, read positionally in the order of the
+            # explicit column lists below
+            db = await aiosqlite.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
+            # WAL doesn't apply to in-memory databases
+            if str(self.db_path) != ":memory:":
+                await db.execute("PRAGMA journal_mode=WAL")
+            await db.execute("PRAGMA synchronous=NORMAL")
+            # Wait for other processes' writes (e.g. a CLI command while the
+            # scheduler runs) instead of failing with "database is locked"
+            await db.execute("PRAGMA busy_timeout=5000")
+            await db.execute("PRAGMA cache_size=-65536")
+            await db.execute("PRAGMA mmap_size=268435456")
+            await db.execute("PRAGMA temp_store=MEMORY")
+            self._db = db
+        return self._db
+
+    async def _get_read_db(self) -> aiosqlite.Connection:
+        """Return the shared read-only connection, opening it on first use.
+
+        An in-memory database is private to its connection, so reads use the
+        main connection there.
+        """
+        if str(self.db_path) == ":memory:":
+            return await self._get_db()
+        if self._read_db is None:
+            # The main connection creates the database file and enables WAL
+            await self._get_db()
+            db = await aiosqlite.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+            await db.execute("PRAGMA query_only=1")
+            await db.execute("PRAGMA busy_timeout=5000")
+            await db.execute("PRAGMA cache_size=-65536")
+            await db.execute("PRAGMA mmap_size=268435456")
+            self._read_db = db
+        return self._read_db
+
+    async def close(self) -> None:
+        """Close the database connections, if they were opened.
+
+        Stops the maintenance task (if started), runs maintenance once more and
+        truncates the WAL file so the next start doesn't replay it.
+        """
+        if self._maintenance_task is not None:
+            task = self._maintenance_task
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+            self._maintenance_task = None
+        if self._read_db is not None:
+            await self._read_db.close()
+            self._read_db = None
+        if self._db is not None:
+            try:
+                await self.maintenance()
+                if str(self.db_path) != ":memory:":
+                    async with self._write_lock:
+                        await self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except Exception as e:
+                logger.warning(f"Database maintenance on close failed: {e}")
+            await self._db.close()
+            self._db = None
+
+    async def maintenance(self) -> None:
+        """Prune expired LLM cache entries and refresh the query planner statistics."""
+        db = await self._get_db()
+        cutoff = datetime.now(timezone.utc) - LLM_CACHE_MAX_AGE
+        async with self._write_lock:
+            # created_at is a UTC ISO string, so it orders lexicographically
+            cursor = await db.execute("DELETE FROM llm_cache WHERE created_at < ?", (cutoff.isoformat(),))
+            await db.commit()
+            if cursor.rowcount > 0:
+                logger.info(f"Pruned {cursor.rowcount} expired LLM cache entries")
+            await db.execute("PRAGMA optimize")
+
+    async def _maintenance_loop(self) -> None:
+        """Run maintenance every MAINTENANCE_INTERVAL seconds until cancelled."""
+        try:
+            while True:
+                await asyncio.sleep(MAINTENANCE_INTERVAL)
+                try:
+                    await self.maintenance()
+                except Exception as e:
+                    logger.warning(f"Database maintenance failed: {e}")
+        finally:
+            # Don't keep the finished task (and this storage) in a reference cycle
+            if self._maintenance_task is asyncio.current_task():
+                self._maintenance_task = None
+
+    def start_maintenance(self) -> None:
+        """Run maintenance every MAINTENANCE_INTERVAL seconds until close().
+
+        Only worth it for long-running processes (the scheduler service);
+        one-shot commands rely on the maintenance run in close().
+        """
+        if self._maintenance_task is None:
+            self._maintenance_task = asyncio.create_task(self._maintenance_loop())
 
     async def initialize(self) -> None:
-        """Create database tables if they don't exist."""
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.executescript("""
-                CREATE TABLE IF NOT EXISTS summaries (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    date TEXT NOT NULL UNIQUE,
-                    accounts_monitored INTEGER,
-                    total_tweets INTEGER,
-                    summary_text TEXT,
-                    analysis TEXT,
-                    key_insights TEXT,
-                    generated_at TEXT NOT NULL
-                );
-
-                CREATE INDEX IF NOT EXISTS idx_summaries_date ON summaries(date);
-
-                CREATE TABLE IF NOT EXISTS tweets (
-                    tweet_id TEXT PRIMARY KEY,
-                    author_username TEXT NOT NULL,
-                    author_display_name TEXT,
-                    content TEXT,
-                    created_at TEXT NOT NULL,
-                    likes INTEGER DEFAULT 0,
-                    retweets INTEGER DEFAULT 0,
-                    replies INTEGER DEFAULT 0,
-                    views INTEGER,
-                    url TEXT,
-                    is_retweet BOOLEAN DEFAULT 0,
-                    is_reply BOOLEAN DEFAULT 0,
-                    media_urls TEXT,
-                    fetched_at TEXT NOT NULL
-                );
-
-                CREATE INDEX IF NOT EXISTS idx_tweets_author ON tweets(author_username);
-                CREATE INDEX IF NOT EXISTS idx_tweets_created ON tweets(created_at);
-            """)
-            await db.commit()
+        """Create database tables if they don't exist, migrating older schemas."""
+        db = await self._get_db()
+        async with self._write_lock:
+            cursor = await db.execute("PRAGMA user_version")
+            row = await cursor.fetchone()
+            version = row[0] if row else 0
+
+            await db.execute("BEGIN")
+            try:
+                if version < SCHEMA_VERSION and await self._table_exists(db, "tweets"):
+                    await self._migrate_tables(db, version)
+                for statement in SCHEMA:
+                    await db.execute(statement)
+                await db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
             logger.info(f"Database initialized at {self.db_path}")
 
         # Initialize accounts config file if it doesn't exist
         if not self.accounts_config_path.exists():
-            self.accounts_config_path.write_text(json.dumps({"accounts": []}, indent=2, ensure_ascii=False))
+            await asyncio.to_thread(
+                _write_atomic, self.accounts_config_path, orjson.dumps({"accounts": []}, option=orjson.OPT_INDENT_2)
+            )
             logger.info(f"Created accounts config file at {self.accounts_config_path}")
 
+    @staticmethod
+    async def _table_exists(db: aiosqlite.Connection, name: str) -> bool:
+        """Check whether a table exists."""
+        cursor = await db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        )
+        return await cursor.fetchone() is not None
+
+    async def _migrate_tables(self, db: aiosqlite.Connection, version: int) -> None:
+        """Migrate a version 0-2 database to the current schema.
+
+        Version 0 stored ISO TEXT timestamps, version 1 REAL epoch seconds for
+        tweets.created_at and summaries.generated_at (fetched_at stayed ISO
+        TEXT), and versions 0-2 kept is_retweet and is_reply as separate
+        columns. The affected tables are rebuilt, since the old column
+        affinities would coerce the integers back to text or floats. Runs
+        inside the caller's transaction.
+        """
+        logger.info(f"Migrating database from schema version {version}...")
+        convert_created: Callable[[Any], int]
+        convert_fetched: Callable[[Any], int]
+        convert_generated: Callable[[Any], int]
+        if version == 0:
+            convert_created = convert_fetched = _iso_to_micros
+            convert_generated = _local_iso_to_micros
+        elif version == 1:
+            convert_created, convert_fetched = _seconds_to_micros, _iso_to_micros
+            convert_generated = _seconds_to_micros
+        else:
+            convert_created = convert_fetched = convert_generated = int
+
+        # Indexes keep their names when a table is renamed, so drop them first
+        indexes = ["idx_tweets_author", "idx_tweets_author_created", "idx_tweets_created"]
+        rebuild_summaries = version < 2 and await self._table_exists(db, "summaries")
+        if rebuild_summaries:
+            indexes.append("idx_summaries_date")
+            await db.execute("ALTER TABLE summaries RENAME TO summaries_old")
+        for index in indexes:
+            await db.execute(f"DROP INDEX IF EXISTS {index}")
+        await db.execute("ALTER TABLE tweets RENAME TO tweets_old")
+        for statement in SCHEMA:
+            await db.execute(statement)
+
+        rows = list(await db.execute_fetchall(
+            "SELECT tweet_id, author_username, author_display_name, content, created_at, "
+            "likes, retweets, replies, views, url, is_retweet, is_reply, media_urls, fetched_at "
+            "FROM tweets_old"
+        ))
+        await db.executemany(
+            INSERT_TWEETS_SQL,
+            [
+                (
+                    *row[:4],
+                    convert_created(row[4]),
+                    *row[5:10],
+                    _tweet_flags(row[10], row[11]),
+                    row[12],
+                    convert_fetched(row[13]),
+                )
+                for row in rows
+            ],
+        )
+        await db.execute("DROP TABLE tweets_old")
+
+        if rebuild_summaries:
+            await db.executemany(
+                f"INSERT INTO summaries ({SUMMARY_COLUMNS}) VALUES ({', '.join('?' * 8)})",
+                [
+                    (*row[:7], convert_generated(row[7]))
+                    for row in await db.execute_fetchall(
+                        f"SELECT {SUMMARY_COLUMNS} FROM summaries_old"
+                    )
+                ],
+            )
+            await db.execute("DROP TABLE summaries_old")
+        logger.info(f"Migrated {len(rows)} tweets to schema version {SCHEMA_VERSION}")
+
     # Account management (JSON-based)
-    def _load_accounts_config(self) -> dict:
-        """Load accounts configuration from JSON file."""
+    async def _load_accounts_config(self) -> dict[str, Any]:
+        """Load accounts configuration from JSON file.
+
+        The parsed config is reused until the file's mtime or size changes, and
+        _username_index maps usernames to its entries. The returned dict is
+        shared and must not be modified; use _load_accounts_config_for_update()
+        to make changes. Reading the file is done in a worker thread.
+        """
         try:
-            if self.accounts_config_path.exists():
-                content = self.accounts_config_path.read_text(encoding="utf-8")
-                return json.loads(content)
-            return {"accounts": []}
+            try:
+                stat = self.accounts_config_path.stat()
+            except FileNotFoundError:
+                config: dict[str, Any] = {"accounts": []}
+                self._config_cache = None
+                self._username_index = {}
+                return config
+            if self._config_cache and self._config_cache[:2] == (stat.st_mtime_ns, stat.st_size):
+                return self._config_cache[2]
+            cached = self._config_cache
+            config = orjson.loads(await asyncio.to_thread(self.accounts_config_path.read_bytes))
+            # A save while the file was being read has already cached a newer config
+            if self._config_cache is cached:
+                self._cache_accounts_config(stat, config)
+            return config
         except Exception as e:
+            self._config_cache = None
+            self._username_index = {}
             logger.error(f"Failed to load accounts config: {e}")
             return {"accounts": []}
 
-    def _save_accounts_config(self, config: dict) -> bool:
-        """Save accounts configuration to JSON file."""
+    async def _load_accounts_config_for_update(self) -> dict[str, Any]:
+        """Load a private copy of the accounts configuration to modify and save.
+
+        Callers must hold the config lock until the copy is saved.
+        """
+        return copy.deepcopy(await self._load_accounts_config())
+
+    def _cache_accounts_config(self, stat: os.stat_result, config: dict[str, Any]) -> None:
+        """Remember a parsed config for the file state it was read from or written as."""
+        self._config_cache = (stat.st_mtime_ns, stat.st_size, config)
+        self._username_index = {acc.get("username"): acc for acc in config["accounts"]}
+
+    async def _save_accounts_config(self, config: dict[str, Any]) -> bool:
+        """Save accounts configuration to JSON file, writing it in a worker thread."""
+        self._account_cache.clear()
+        self._accounts_cache = None
         try:
-            self.accounts_config_path.write_text(
-                json.dumps(config, indent=2, ensure_ascii=False),
-                encoding="utf-8"
+            await asyncio.to_thread(
+                _write_atomic, self.accounts_config_path, orjson.dumps(config, option=orjson.OPT_INDENT_2)
             )
+            self._cache_accounts_config(self.accounts_config_path.stat(), config)
             return True
         except Exception as e:
+            self._config_cache = None
+            self._username_index = {}
             logger.error(f"Failed to save accounts config: {e}")
             return False
 
+    @staticmethod
+    def _account_entry(account: Account) -> dict[str, Any]:
+        """Build the JSON config entry for an account."""
+        entry = {
+            "username": account.username,
+            "note": account.description or account.display_name or "",
+        }
+        if account.user_id:
+            entry["user_id"] = account.user_id
+        if account.display_name:
+            entry["display_name"] = account.display_name
+        if account.description:
+            entry["description"] = account.description
+        return entry
+
+    async def add_accounts(self, accounts: list[Account]) -> bool:
+        """Add several accounts to the JSON config file with a single write.
+
+        Accounts that already exist in the config are skipped.
+        """
+        async with self._config_lock:
+            try:
+                config = await self._load_accounts_config_for_update()
+
+                added = []
+                for account in accounts:
+                    # Check if account already exists
+                    if account.username in self._username_index or account.username in added:
+                        logger.warning(f"Account @{account.username} already exists in config")
+                        continue
+                    # Add new account with cached user info
+                    config["accounts"].append(self._account_entry(account))
+                    added.append(account.username)
+
+                if not added:
+                    return True
+                if await self._save_accounts_config(config):
+                    logger.info(f"Added account(s) to config: {', '.join('@' + username for username in added)}")
+                    return True
+                return False
+            except Exception as e:
+                logger.error(f"Failed to add accounts {', '.join(a.username for a in accounts)}: {e}")
+                return False
+
     async def add_account(self, account: Account) -> bool:
         """Add an account to the JSON config file."""
-        try:
-            config = self._load_accounts_config()
+        return await self.add_accounts([account])
 
-            # Check if account already exists
-            existing_usernames = {acc["username"] for acc in config["accounts"]}
-            if account.username in existing_usernames:
-                logger.warning(f"Account @{account.username} already exists in config")
-                return True
+    async def update_accounts_info(self, accounts: list[Account]) -> bool:
+        """Update cached user info for several accounts with a single config write.
 
-            # Add new account with cached user info
-            entry = {
-                "username": account.username,
-                "note": account.description or account.display_name or "",
-            }
-            if account.user_id:
-                entry["user_id"] = account.user_id
-            if account.display_name:
-                entry["display_name"] = account.display_name
-            if account.description:
-                entry["description"] = account.description
-
-            config["accounts"].append(entry)
-
-            if self._save_accounts_config(config):
-                logger.info(f"Added account to config: @{account.username}")
-                return True
-            return False
-        except Exception as e:
-            logger.error(f"Failed to add account {account.username}: {e}")
-            return False
+        Args:
+            accounts: Accounts carrying the fetched user_id, display_name and description
+
+        Returns:
+            True if at least one account was updated and the config was saved
+        """
+        async with self._config_lock:
+            try:
+                await self._load_accounts_config()
+                by_username = {}
+                for account in accounts:
+                    if account.username in self._username_index:
+                        by_username[account.username] = account
+                    else:
+                        logger.warning(f"Account @{account.username} not found in config for update")
+                if not by_username:
+                    return False
+
+                config = await self._load_accounts_config_for_update()
+                updated = 0
+                for acc in config["accounts"]:
+                    new_info = by_username.get(acc["username"])
+                    if new_info is None:
+                        continue
+                    acc["user_id"] = new_info.user_id
+                    if new_info.display_name:
+                        acc["display_name"] = new_info.display_name
+                    if new_info.description:
+                        acc["description"] = new_info.description
+                    updated += 1
+
+                if not updated:
+                    return False
+                return await self._save_accounts_config(config)
+            except Exception as e:
+                logger.error(f"Failed to update account info for {', '.join(a.username for a in accounts)}: {e}")
+                return False
 
     async def update_account_info(
         self, username: str, user_id: str, display_name: str | None, description: str | None
     ) -> bool:
         """Update cached user info for an account in JSON config."""
-        try:
-            config = self._load_accounts_config()
-            for acc in config["accounts"]:
-                if acc["username"] == username:
-                    acc["user_id"] = user_id
-                    if display_name:
-                        acc["display_name"] = display_name
-                    if description:
-                        acc["description"] = description
-                    return self._save_accounts_config(config)
-            logger.warning(f"Account @{username} not found in config for update")
-            return False
-        except Exception as e:
-            logger.error(f"Failed to update account info for {username}: {e}")
-            return False
+        return await self.update_accounts_info(
+            [Account(username=username, user_id=user_id, display_name=display_name, description=description)]
+        )
 
     async def remove_account(self, username: str) -> bool:
         """Remove an account from the JSON config file."""
-        try:
-            config = self._load_accounts_config()
-            original_count = len(config["accounts"])
-
-            # Filter out the account
-            config["accounts"] = [
-                acc for acc in config["accounts"]
-                if acc["username"] != username
-            ]
-
-            if len(config["accounts"]) < original_count:
-                if self._save_accounts_config(config):
+        async with self._config_lock:
+            try:
+                await self._load_accounts_config()
+                if username not in self._username_index:
+                    logger.warning(f"Account @{username} not found in config")
+                    return False
+
+                config = await self._load_accounts_config_for_update()
+                # Filter out the account
+                config["accounts"] = [
+                    acc for acc in config["accounts"]
+                    if acc["username"] != username
+                ]
+
+                if await self._save_accounts_config(config):
                     logger.info(f"Removed account from config: @{username}")
                     return True
-            else:
-                logger.warning(f"Account @{username} not found in config")
-            return False
-        except Exception as e:
-            logger.error(f"Failed to remove account {username}: {e}")
-            return False
+                return False
+            except Exception as e:
+                logger.error(f"Failed to remove account {username}: {e}")
+                return False
 
     async def get_accounts(self) -> list[Account]:
-        """Get all monitored accounts from JSON config file."""
+        """Get all monitored accounts from JSON config file.
+
+        Like get_account, results are cached for ACCOUNT_CACHE_TTL seconds and
+        the cache is cleared whenever the accounts config is saved.
+        """
+        now = time.monotonic()
+        if self._accounts_cache and self._accounts_cache[0] > now:
+            return list(self._accounts_cache[1])
+
         try:
-            config = self._load_accounts_config()
-            accounts = []
-
-            for acc_data in config["accounts"]:
-                username = acc_data.get("username", "").strip()
-                if username:
-                    accounts.append(
-                        Account(
-                            username=username,
-                            user_id=acc_data.get("user_id"),
-                            display_name=acc_data.get("display_name") or acc_data.get("note", ""),
-                            description=acc_data.get("description") or acc_data.get("note", ""),
-                        )
-                    )
+            config = await self._load_accounts_config()
+            accounts = [
+                Account(
+                    username=username,
+                    user_id=acc_data.get("user_id"),
+                    display_name=acc_data.get("display_name") or acc_data.get("note", ""),
+                    description=acc_data.get("description") or acc_data.get("note", ""),
+                )
+                for acc_data in config["accounts"]
+                if (username := acc_data.get("username", "").strip())
+            ]
 
             logger.info(f"Loaded {len(accounts)} accounts from config file")
-            return accounts
+            if self._config_cache and self._config_cache[2] is config:
+                self._accounts_cache = (now + ACCOUNT_CACHE_TTL, accounts)
+            return list(accounts)
         except Exception as e:
             logger.error(f"Failed to get accounts: {e}")
             return []
 
     async def get_account(self, username: str) -> Account | None:
-        """Get a specific account from JSON config file."""
+        """Get a specific account from JSON config file.
+
+        Results are cached for ACCOUNT_CACHE_TTL seconds and the cache is cleared
+        whenever the accounts config is saved.
+        """
+        now = time.monotonic()
+        cached = self._account_cache.get(username)
+        if cached and cached[0] > now:
+            # Move the entry to the end, so eviction drops the least recently used
+            self._account_cache[username] = self._account_cache.pop(username)
+            return cached[1]
+
         try:
-            config = self._load_accounts_config()
-
-            for acc_data in config["accounts"]:
-                if acc_data.get("username") == username:
-                    return Account(
-                        username=username,
-                        user_id=acc_data.get("user_id"),
-                        display_name=acc_data.get("display_name") or acc_data.get("note", ""),
-                        description=acc_data.get("description") or acc_data.get("note", ""),
-                    )
-            return None
+            await self._load_accounts_config()
+
+            account = None
+            acc_data = self._username_index.get(username)
+            if acc_data is not None:
+                account = Account(
+                    username=username,
+                    user_id=acc_data.get("user_id"),
+                    display_name=acc_data.get("display_name") or acc_data.get("note", ""),
+                    description=acc_data.get("description") or acc_data.get("note", ""),
+                )
+
+            if username not in self._account_cache and len(self._account_cache) >= ACCOUNT_CACHE_SIZE:
+                # Evict the least recently used entry (dicts keep insertion order)
+                self._account_cache.pop(next(iter(self._account_cache)))
+            self._account_cache.pop(username, None)
+            self._account_cache[username] = (now + ACCOUNT_CACHE_TTL, account)
+            return account
         except Exception as e:
             logger.error(f"Failed to get account {username}: {e}")
             return None
@@ -213,91 +703,178 @@ class Storage:
         """Save tweets to database. Returns number of new tweets saved."""
         if not tweets:
             return 0
-        now = datetime.now(timezone.utc).isoformat()
-        saved = 0
-        async with aiosqlite.connect(self.db_path) as db:
-            for tweet in tweets:
-                try:
-                    await db.execute(
-                        """
-                        INSERT OR IGNORE INTO tweets
-                        (tweet_id, author_username, author_display_name, content, created_at,
-                         likes, retweets, replies, views, url, is_retweet, is_reply, media_urls, fetched_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            tweet.tweet_id,
-                            tweet.author_username,
-                            tweet.author_display_name,
-                            tweet.content,
-                            tweet.created_at.isoformat(),
-                            tweet.likes,
-                            tweet.retweets,
-                            tweet.replies,
-                            tweet.views,
-                            tweet.url,
-                            tweet.is_retweet,
-                            tweet.is_reply,
-                            json.dumps(tweet.media_urls) if tweet.media_urls else "[]",
-                            now,
-                        ),
-                    )
-                    if db.total_changes:
-                        saved += 1
-                except Exception as e:
-                    logger.error(f"Failed to save tweet {tweet.tweet_id}: {e}")
-            await db.commit()
+        db = await self._get_db()
+        async with self._write_lock:
+            saved = await self._insert_tweets(db, tweets)
         if saved:
             logger.info(f"Saved {saved} new tweets to database")
         return saved
 
+    async def save_tweets_and_get_since(
+        self, tweets: list[Tweet], since: datetime
+    ) -> tuple[int, list[Tweet]]:
+        """Save tweets and read back all tweets since a given time.
+
+        The read runs right after the write's commit, so it observes the
+        saved tweets.
+
+        Returns:
+            Tuple of (number of new tweets saved, tweets since the given time)
+        """
+        db = await self._get_db()
+        async with self._write_lock:
+            saved = await self._insert_tweets(db, tweets) if tweets else 0
+        recent = await self._select_tweets_since(await self._get_read_db(), since)
+        if saved:
+            logger.info(f"Saved {saved} new tweets to database")
+        return saved, recent
+
+    async def _insert_tweets(self, db: aiosqlite.Connection, tweets: list[Tweet]) -> int:
+        """Insert tweets in one executemany call and commit. Returns number saved.
+
+        Callers must hold the write lock.
+        """
+        now = _to_micros(datetime.now(timezone.utc))
+        rows = [
+            (
+                tweet.tweet_id,
+                tweet.author_username,
+                tweet.author_display_name,
+                tweet.content,
+                _to_micros(tweet.created_at),
+                tweet.likes,
+                tweet.retweets,
+                tweet.replies,
+                tweet.views,
+                tweet.url,
+                _tweet_flags(tweet.is_retweet, tweet.is_reply),
+                orjson.dumps(tweet.media_urls).decode() if tweet.media_urls else "[]",
+                now,
+            )
+            for tweet in tweets
+        ]
+        try:
+            cursor = await db.executemany(INSERT_TWEETS_SQL, rows)
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Failed to save {len(rows)} tweets: {e}")
+            return 0
+        # Ignored duplicates don't count towards the row count
+        return cursor.rowcount
+
     async def get_last_tweet_time(self, username: str) -> datetime | None:
         """Get the most recent tweet time for an account."""
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                "SELECT MAX(created_at) FROM tweets WHERE author_username = ?",
-                (username,),
-            )
-            row = await cursor.fetchone()
-            if row and row[0]:
-                return datetime.fromisoformat(row[0])
+        db = await self._get_read_db()
+        cursor = await db.execute(
+            "SELECT MAX(created_at) FROM tweets WHERE author_username = ?",
+            (username,),
+        )
+        row = await cursor.fetchone()
+        if row and row[0]:
+            return _from_micros(row[0])
         return None
 
+    async def get_last_tweet_times(self, usernames: list[str]) -> dict[str, datetime]:
+        """Get the most recent tweet time for several accounts in a single query.
+
+        Accounts without any stored tweets are omitted from the result.
+        """
+        if not usernames:
+            return {}
+        placeholders = ", ".join("?" for _ in usernames)
+        db = await self._get_read_db()
+        cursor = await db.execute(
+            f"SELECT author_username, MAX(created_at) FROM tweets "
+            f"WHERE author_username IN ({placeholders}) GROUP BY author_username",
+            usernames,
+        )
+        rows = await cursor.fetchall()
+        return {row[0]: _from_micros(row[1]) for row in rows if row[1]}
+
+    async def get_last_tweet_ids(self, usernames: list[str]) -> dict[str, str]:
+        """Get the newest stored tweet ID for several accounts in a single query.
+
+        Tweet IDs are compared numerically. Accounts without any stored tweets
+        are omitted from the result.
+        """
+        if not usernames:
+            return {}
+        placeholders = ", ".join("?" for _ in usernames)
+        db = await self._get_read_db()
+        cursor = await db.execute(
+            f"SELECT author_username, MAX(CAST(tweet_id AS INTEGER)) FROM tweets "
+            f"WHERE author_username IN ({placeholders}) GROUP BY author_username",
+            usernames,
+        )
+        rows = await cursor.fetchall()
+        return {row[0]: str(row[1]) for row in rows if row[1]}
+
     async def get_tweets_since(self, since: datetime, username: str | None = None) -> list[Tweet]:
         """Get tweets from local database since a given time."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            if username:
-                cursor = await db.execute(
-                    "SELECT * FROM tweets WHERE created_at >= ? AND author_username = ? ORDER BY created_at DESC",
-                    (since.isoformat(), username),
-                )
-            else:
-                cursor = await db.execute(
-                    "SELECT * FROM tweets WHERE created_at >= ? ORDER BY created_at DESC",
-                    (since.isoformat(),),
-                )
-            rows = await cursor.fetchall()
-
-            return [
-                Tweet(
-                    tweet_id=row["tweet_id"],
-                    author_username=row["author_username"],
-                    author_display_name=row["author_display_name"],
-                    content=row["content"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    likes=row["likes"],
-                    retweets=row["retweets"],
-                    replies=row["replies"],
-                    views=row["views"],
-                    url=row["url"],
-                    is_retweet=bool(row["is_retweet"]),
-                    is_reply=bool(row["is_reply"]),
-                    media_urls=json.loads(row["media_urls"]) if row["media_urls"] else [],
-                )
-                for row in rows
-            ]
-    
+        return await self._select_tweets_since(await self._get_read_db(), since, username)
+
+    async def _select_tweets_since(
+        self, db: aiosqlite.Connection, since: datetime, username: str | None = None
+    ) -> list[Tweet]:
+        """Read tweets since a given time on an open connection."""
+        if username:
+            cursor = await db.execute(SELECT_USER_TWEETS_SINCE_SQL, (_to_micros(since), username))
+        else:
+            cursor = await db.execute(SELECT_TWEETS_SINCE_SQL, (_to_micros(since),))
+        rows = await cursor.fetchall()
+
+        return [self._row_to_tweet(row) for row in rows]
+
+    @staticmethod
+    def _row_to_tweet(row: DbRow) -> Tweet:
+        """Build a Tweet from a row selected with TWEET_COLUMNS."""
+        (
+            tweet_id, author_username, author_display_name, content, created_at,
+            likes, retweets, replies, views, url, flags, media_urls,
+        ) = row
+        return Tweet(
+            tweet_id=tweet_id,
+            author_username=author_username,
+            author_display_name=author_display_name,
+            content=content,
+            created_at=_from_micros(created_at),
+            likes=likes,
+            retweets=retweets,
+            replies=replies,
+            views=views,
+            url=url,
+            is_retweet=bool(flags & TWEET_FLAG_RETWEET),
+            is_reply=bool(flags & TWEET_FLAG_REPLY),
+            media_urls=orjson.loads(media_urls) if media_urls else [],
+        )
+
+    async def iter_tweets_between(
+        self, start: datetime, end: datetime, username: str | None = None
+    ) -> AsyncIterator[Tweet]:
+        """Yield tweets between two times, newest first, as rows are read.
+
+        Rows are fetched TWEET_FETCH_SIZE at a time, so a long range isn't
+        held in memory at once.
+
+        Args:
+            start: Start time (inclusive)
+            end: End time (inclusive)
+            username: Optional username filter
+        """
+        db = await self._get_read_db()
+        params: tuple[int | str, ...]
+        if username:
+            query = SELECT_USER_TWEETS_BETWEEN_SQL
+            params = (_to_micros(start), _to_micros(end), username)
+        else:
+            query = SELECT_TWEETS_BETWEEN_SQL
+            params = (_to_micros(start), _to_micros(end))
+        async with db.execute(query, params) as cursor:
+            cursor.iter_chunk_size = TWEET_FETCH_SIZE
+            async for row in cursor:
+                yield self._row_to_tweet(row)
+
     async def get_tweets_between(self, start: datetime, end: datetime, username: str | None = None) -> list[Tweet]:
         """Get tweets from local database between two times.
         
@@ -309,62 +886,28 @@ class Storage:
         Returns:
             List of tweets sorted by creation time (newest first)
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            if username:
-                cursor = await db.execute(
-                    "SELECT * FROM tweets WHERE created_at >= ? AND created_at <= ? AND author_username = ? ORDER BY created_at DESC",
-                    (start.isoformat(), end.isoformat(), username),
-                )
-            else:
-                cursor = await db.execute(
-                    "SELECT * FROM tweets WHERE created_at >= ? AND created_at <= ? ORDER BY created_at DESC",
-                    (start.isoformat(), end.isoformat()),
-                )
-            rows = await cursor.fetchall()
-
-            return [
-                Tweet(
-                    tweet_id=row["tweet_id"],
-                    author_username=row["author_username"],
-                    author_display_name=row["author_display_name"],
-                    content=row["content"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                    likes=row["likes"],
-                    retweets=row["retweets"],
-                    replies=row["replies"],
-                    views=row["views"],
-                    url=row["url"],
-                    is_retweet=bool(row["is_retweet"]),
-                    is_reply=bool(row["is_reply"]),
-                    media_urls=json.loads(row["media_urls"]) if row["media_urls"] else [],
-                )
-                for row in rows
-            ]
+        return [tweet async for tweet in self.iter_tweets_between(start, end, username)]
 
     # Summary management
     async def save_summary(self, summary: DailySummary) -> bool:
         """Save a daily summary."""
-        async with aiosqlite.connect(self.db_path) as db:
+        db = await self._get_db()
+        async with self._write_lock:
             try:
                 await db.execute(
-                    """
-                    INSERT OR REPLACE INTO summaries
-                    (date, accounts_monitored, total_tweets, summary_text, analysis, key_insights, generated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
+                    UPSERT_SUMMARY_SQL,
                     (
-                        summary.date.strftime("%Y-%m-%d"),
+                        summary.date_key,
                         summary.accounts_monitored,
                         summary.total_tweets,
                         summary.summary_text,
                         summary.analysis,
-                        json.dumps(summary.key_insights, ensure_ascii=False),
-                        summary.generated_at.isoformat(),
+                        orjson.dumps(summary.key_insights).decode(),
+                        _to_micros(summary.generated_at),
                     ),
                 )
                 await db.commit()
-                logger.info(f"Saved summary for {summary.date.strftime('%Y-%m-%d')}")
+                logger.info(f"Saved summary for {summary.date_key}")
                 return True
             except Exception as e:
                 logger.error(f"Failed to save summary: {e}")
@@ -372,44 +915,78 @@ class Storage:
 
     async def get_summary(self, date: datetime) -> DailySummary | None:
         """Get summary for a specific date."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                "SELECT * FROM summaries WHERE date = ?",
-                (date.strftime("%Y-%m-%d"),),
-            )
-            row = await cursor.fetchone()
+        db = await self._get_read_db()
+        cursor = await db.execute(SELECT_SUMMARY_SQL, (date.strftime("%Y-%m-%d"),))
+        row = await cursor.fetchone()
 
-            if row:
-                return DailySummary(
-                    date=datetime.strptime(row["date"], "%Y-%m-%d"),
-                    accounts_monitored=row["accounts_monitored"],
-                    total_tweets=row["total_tweets"],
-                    summary_text=row["summary_text"],
-                    analysis=row["analysis"],
-                    key_insights=json.loads(row["key_insights"]) if row["key_insights"] else [],
-                    generated_at=datetime.fromisoformat(row["generated_at"]),
-                )
-            return None
+        if row:
+            return self._row_to_summary(row)
+        return None
+
+    async def iter_recent_summaries(self, days: int = 7) -> AsyncIterator[DailySummary]:
+        """Yield recent summaries, newest first, as rows are read from the database."""
+        db = await self._get_read_db()
+        async with db.execute(SELECT_RECENT_SUMMARIES_SQL, (days,)) as cursor:
+            async for row in cursor:
+                yield self._row_to_summary(row)
 
     async def get_recent_summaries(self, days: int = 7) -> list[DailySummary]:
         """Get recent summaries."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        return [summary async for summary in self.iter_recent_summaries(days)]
+
+    @staticmethod
+    def _row_to_summary(row: DbRow) -> DailySummary:
+        """Build a DailySummary from a row selected with SUMMARY_COLUMNS."""
+        (
+            _, date, accounts_monitored, total_tweets, summary_text, analysis,
+            key_insights, generated_at,
+        ) = row
+        return DailySummary(
+            date=_parse_date(date),
+            accounts_monitored=accounts_monitored,
+            total_tweets=total_tweets,
+            summary_text=summary_text,
+            analysis=analysis,
+            key_insights=orjson.loads(key_insights) if key_insights else [],
+            # Shown in reports, so read back in local time like new summaries
+            generated_at=_from_micros(generated_at).astimezone(),
+        )
+
+    # LLM response cache
+    async def get_llm_cache(self, key: str) -> tuple[str, list[str]] | None:
+        """Get a cached LLM analysis. Returns (analysis, key_insights) or None."""
+        try:
+            db = await self._get_read_db()
             cursor = await db.execute(
-                "SELECT * FROM summaries ORDER BY date DESC LIMIT ?", (days,)
+                "SELECT analysis, key_insights FROM llm_cache WHERE key = ?", (key,)
             )
-            rows = await cursor.fetchall()
-
-            return [
-                DailySummary(
-                    date=datetime.strptime(row["date"], "%Y-%m-%d"),
-                    accounts_monitored=row["accounts_monitored"],
-                    total_tweets=row["total_tweets"],
-                    summary_text=row["summary_text"],
-                    analysis=row["analysis"],
-                    key_insights=json.loads(row["key_insights"]) if row["key_insights"] else [],
-                    generated_at=datetime.fromisoformat(row["generated_at"]),
+            row = await cursor.fetchone()
+            if row:
+                return row[0], orjson.loads(row[1]) if row[1] else []
+            return None
+        except Exception as e:
+            logger.error(f"Failed to read LLM cache: {e}")
+            return None
+
+    async def set_llm_cache(self, key: str, analysis: str, key_insights: list[str]) -> bool:
+        """Cache an LLM analysis under the given key."""
+        try:
+            db = await self._get_db()
+            async with self._write_lock:
+                await db.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_cache (key, analysis, key_insights, created_at)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (
+                        key,
+                        analysis,
+                        orjson.dumps(key_insights).decode(),
+                        datetime.now(timezone.utc).isoformat(),
+                    ),
                 )
-                for row in rows
-            ]
+                await db.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write LLM cache: {e}")
+            return False
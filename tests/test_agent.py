@@ -0,0 +1,37 @@
+"""Tests for the monitor agent."""
+
+import asyncio
+from datetime import datetime, timezone
+
+from src.agent import XMonitorAgent
+from src.config import Settings
+from src.models import Tweet
+from tests.test_llm_analyzer import StubCompletions
+
+
+def test_regenerate_report_skips_llm_cache(tmp_path, monkeypatch):
+    """Test that regenerating a report redoes the analysis even when it is cached."""
+    monkeypatch.chdir(tmp_path)
+    settings = Settings(x_bearer_token="token", openai_api_key="key", database_path=str(tmp_path / "x.db"))
+    date = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    completions = StubCompletions()
+
+    async def _run() -> tuple[str, str]:
+        agent = XMonitorAgent(settings)
+        monkeypatch.setattr(agent.analyzer.client.chat.completions, "create", completions.create)
+        await agent.initialize()
+        try:
+            await agent.storage.save_tweets([
+                Tweet(tweet_id="1", author_username="alice", content="hello", created_at=date.replace(hour=10))
+            ])
+            first = await agent.regenerate_report_from_db(date)
+            second = await agent.regenerate_report_from_db(date)
+            assert first is not None and second is not None
+            return first.analysis, second.analysis
+        finally:
+            await agent.close()
+
+    first, second = asyncio.run(_run())
+
+    assert len(completions.prompts) == 2
+    assert first != second
@@ -0,0 +1,38 @@
+"""Tests for application settings."""
+
+from src.config import get_settings
+
+
+def test_get_settings_is_cached(monkeypatch):
+    """Test that settings are loaded once and reloaded after cache_clear()."""
+    monkeypatch.setenv("X_BEARER_TOKEN", "token-1")
+    monkeypatch.setenv("OPENAI_API_KEY", "key")
+    get_settings.cache_clear()
+
+    try:
+        settings = get_settings()
+        assert get_settings() is settings
+
+        monkeypatch.setenv("X_BEARER_TOKEN", "token-2")
+        assert get_settings().x_bearer_token == "token-1"
+
+        get_settings.cache_clear()
+        assert get_settings().x_bearer_token == "token-2"
+    finally:
+        get_settings.cache_clear()
+
+
+def test_split_by_account_settings(monkeypatch):
+    """Test that the per-account analysis flags are read from the environment."""
+    monkeypatch.setenv("X_BEARER_TOKEN", "token")
+    monkeypatch.setenv("OPENAI_API_KEY", "key")
+    monkeypatch.setenv("OPENAI_SPLIT_BY_ACCOUNT", "true")
+    monkeypatch.setenv("OPENAI_CONCURRENCY_LIMIT", "3")
+    get_settings.cache_clear()
+
+    try:
+        settings = get_settings()
+        assert settings.openai_split_by_account is True
+        assert settings.openai_concurrency_limit == 3
+    finally:
+        get_settings.cache_clear()
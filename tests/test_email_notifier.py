@@ -0,0 +1,60 @@
+"""Tests for the email notifier."""
+
+import asyncio
+from datetime import datetime, timezone
+from email.message import EmailMessage
+from typing import ClassVar
+
+import aiosmtplib
+
+from src.models import DailySummary
+from src.notifiers import email_notifier
+from src.notifiers.email_notifier import EmailNotifier
+
+
+class FakeSMTP:
+    """In-memory SMTP client whose first connection is dropped by the server."""
+
+    instances: ClassVar[list["FakeSMTP"]] = []
+
+    def __init__(self, **kwargs: object) -> None:
+        self.is_connected = False
+        self.closed = False
+        self.sent: list[EmailMessage] = []
+        FakeSMTP.instances.append(self)
+
+    async def connect(self) -> None:
+        self.is_connected = True
+
+    async def send_message(self, message: EmailMessage) -> None:
+        if len(FakeSMTP.instances) == 1:
+            raise aiosmtplib.SMTPServerDisconnected("Server disconnected")
+        self.sent.append(message)
+
+    async def quit(self) -> None:
+        self.is_connected = False
+
+    def close(self) -> None:
+        self.closed = True
+        self.is_connected = False
+
+
+def test_send_summary_reconnects_after_disconnect(monkeypatch):
+    """Test that a dropped SMTP connection is closed and the send retried once."""
+    FakeSMTP.instances = []
+    monkeypatch.setattr(email_notifier.aiosmtplib, "SMTP", FakeSMTP)
+    summary = DailySummary(date=datetime(2025, 1, 1, tzinfo=timezone.utc), analysis="analysis")
+
+    async def _run() -> bool:
+        notifier = EmailNotifier("smtp.example.com", 587, "from@example.com", "pw", "to@example.com")
+        try:
+            return await notifier.send_summary(summary)
+        finally:
+            await notifier.close()
+
+    assert asyncio.run(_run())
+
+    first, second = FakeSMTP.instances
+    assert first.closed
+    assert [message["To"] for message in second.sent] == ["to@example.com"]
+    assert not second.is_connected
@@ -0,0 +1,186 @@
+"""Tests for the LLM analyzer."""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from src.analyzers.llm_analyzer import LLMAnalyzer, _extract_key_insights
+from src.models import Tweet
+from src.storage import Storage
+
+
+ANALYSIS = """## 1. 🔥 今日必看
+- 第一条非常重要的内容在这里出现了
+- 短
+2. 第二条非常重要的内容在这里出现了
+* 第三条非常重要的内容在这里出现了
+
+## 2. 📚 LLM 学习与技术实践
+- 这一节的内容不应该被当作洞察
+
+## 5. 🎯 关键洞察
+1. 第四条洞察内容比较长一点点点
+2. 第五条洞察内容比较长一点点点
+3. 第六条洞察内容比较长一点点点
+"""
+
+
+class StubCompletions:
+    """Stand-in for client.chat.completions that records prompts and concurrency."""
+
+    def __init__(self, fail_authors: tuple[str, ...] = ()):
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_authors = fail_authors
+
+    async def create(self, **kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if any(f"@{author} " in prompt for author in self.fail_authors):
+                raise RuntimeError("API error")
+            text = "综合分析" if "各账号要点" in prompt else f"要点 {len(self.prompts)}"
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=text), finish_reason="stop")]
+            )
+        finally:
+            self.in_flight -= 1
+
+
+def _split_analyzer(completions: StubCompletions, concurrency_limit: int = 5) -> LLMAnalyzer:
+    analyzer = LLMAnalyzer(api_key="key", split_by_author=True, concurrency_limit=concurrency_limit)
+    analyzer.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return analyzer
+
+
+def _tweets(authors: list[str]) -> list[Tweet]:
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        Tweet(tweet_id=str(i), author_username=author, content="hello", created_at=created_at)
+        for i, author in enumerate(authors)
+    ]
+
+
+def test_split_by_author_synthesizes_per_author_summaries():
+    """Test one call per author plus a synthesis call, capped by the concurrency limit."""
+    completions = StubCompletions()
+    analyzer = _split_analyzer(completions, concurrency_limit=2)
+    authors = ["a", "b", "c", "d", "e"]
+
+    summary = asyncio.run(analyzer.analyze_tweets(_tweets(authors), datetime(2025, 1, 1)))
+
+    assert len(completions.prompts) == len(authors) + 1
+    assert "各账号要点" in completions.prompts[-1]
+    assert completions.max_in_flight == 2
+    assert summary.analysis.startswith("综合分析")
+    assert all(f"**@{author}**" in summary.analysis for author in authors)
+
+
+def test_split_by_author_skips_synthesis_when_all_authors_fail():
+    """Test that a failed fan-out yields the failure summary without a synthesis call."""
+    completions = StubCompletions(fail_authors=("a", "b"))
+    analyzer = _split_analyzer(completions)
+
+    summary = asyncio.run(analyzer.analyze_tweets(_tweets(["a", "b"]), datetime(2025, 1, 1)))
+
+    assert len(completions.prompts) == 2
+    assert summary.analysis == ""
+    assert summary.summary_text.startswith("分析生成失败")
+
+
+def test_split_by_author_keeps_successful_authors():
+    """Test that one failed author is marked as failed while the report is still built."""
+    completions = StubCompletions(fail_authors=("a",))
+    analyzer = _split_analyzer(completions)
+
+    summary = asyncio.run(analyzer.analyze_tweets(_tweets(["a", "b"]), datetime(2025, 1, 1)))
+
+    assert len(completions.prompts) == 3
+    assert "**@a**\n（分析生成失败）" in summary.analysis
+    assert summary.analysis.startswith("综合分析")
+
+
+def test_cached_analysis_skips_client(tmp_path):
+    """Test that a second analysis of the same tweets is served from the cache."""
+    completions = StubCompletions()
+    tweets = _tweets(["a", "b"])
+
+    async def _run() -> tuple[str, str]:
+        storage = Storage(str(tmp_path / "x.db"), str(tmp_path / "accounts.json"))
+        await storage.initialize()
+        try:
+            analyzer = LLMAnalyzer(api_key="key", cache=storage)
+            analyzer.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+            first = await analyzer.analyze_tweets(tweets, datetime(2025, 1, 1))
+            second = await analyzer.analyze_tweets(tweets, datetime(2025, 1, 1))
+            return first.analysis, second.analysis
+        finally:
+            await storage.close()
+
+    first, second = asyncio.run(_run())
+
+    assert len(completions.prompts) == 1
+    assert second == first
+
+
+def test_refresh_bypasses_cache_and_replaces_entry(tmp_path):
+    """Test that use_cache=False calls the client again and caches the new analysis."""
+    completions = StubCompletions()
+    tweets = _tweets(["a"])
+    date = datetime(2025, 1, 1)
+
+    async def _run() -> tuple[str, str, str]:
+        storage = Storage(str(tmp_path / "x.db"), str(tmp_path / "accounts.json"))
+        await storage.initialize()
+        try:
+            analyzer = LLMAnalyzer(api_key="key", cache=storage)
+            analyzer.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+            first = await analyzer.analyze_tweets(tweets, date)
+            refreshed = await analyzer.analyze_tweets(tweets, date, use_cache=False)
+            cached = await analyzer.analyze_tweets(tweets, date)
+            return first.analysis, refreshed.analysis, cached.analysis
+        finally:
+            await storage.close()
+
+    first, refreshed, cached = asyncio.run(_run())
+
+    assert len(completions.prompts) == 2
+    assert refreshed != first
+    assert cached == refreshed
+
+
+def test_extract_key_insights_from_sections():
+    """Test that only list items from key sections are extracted, up to 5."""
+    insights = _extract_key_insights(ANALYSIS)
+    assert insights == [
+        "第一条非常重要的内容在这里出现了",
+        "第二条非常重要的内容在这里出现了",
+        "第三条非常重要的内容在这里出现了",
+        "第四条洞察内容比较长一点点点",
+        "第五条洞察内容比较长一点点点",
+    ]
+
+
+def test_extract_key_insights_without_sections():
+    """Test that text without key sections yields no insights."""
+    assert _extract_key_insights("## 标题\n- 普通列表项内容足够长足够长") == []
+
+
+def test_close_only_closes_own_client():
+    """Test that each analyzer owns its client and close() leaves others open."""
+
+    async def _run() -> None:
+        first = LLMAnalyzer(api_key="key")
+        second = LLMAnalyzer(api_key="key")
+        assert first.client is not second.client
+
+        await first.close()
+        assert first.client.is_closed()
+        assert not second.client.is_closed()
+        await second.close()
+
+    asyncio.run(_run())
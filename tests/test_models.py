@@ -1,8 +1,9 @@
 """Tests for data models."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
+from pydantic import ValidationError
 
 from src.models import Tweet, Account, DailySummary
 
@@ -29,6 +30,13 @@ def test_tweet_engagement_score():
     assert tweet.engagement_score == 26
 
 
+def test_tweet_created_at_ts():
+    """Test that the epoch timestamp matches the creation time."""
+    created_at = datetime(2025, 1, 1, 12, 30, tzinfo=timezone.utc)
+    tweet = Tweet(tweet_id="1", author_username="test", content="x", created_at=created_at)
+    assert tweet.created_at_ts == 1735734600
+
+
 def test_daily_summary_defaults():
     """Test DailySummary default values."""
     summary = DailySummary(date=datetime.now())
@@ -36,3 +44,46 @@ def test_daily_summary_defaults():
     assert summary.total_tweets == 0
     assert summary.tweets == []
     assert summary.key_insights == []
+
+
+def test_models_are_frozen():
+    """Test that models reject attribute assignment."""
+    account = Account(username="testuser")
+    with pytest.raises(ValidationError):
+        account.user_id = "123"
+
+
+def test_daily_summary_display_strings():
+    """Test DailySummary date strings and timezone-aware generation time."""
+    summary = DailySummary(date=datetime(2026, 2, 3), key_insights=["first", "second"])
+    assert summary.date_key == "2026-02-03"
+    assert summary.date_display == "2026年02月03日"
+    assert summary.generated_at.tzinfo is not None
+    assert summary.insights_text == "1. first\n2. second\n"
+
+
+def test_tweet_author_names_are_interned():
+    """Test that tweets from the same author share one username string."""
+    tweets = [
+        Tweet(
+            tweet_id=str(i),
+            author_username="".join(["test", "user"]),
+            content="Hello",
+            created_at=datetime.now(),
+        )
+        for i in range(2)
+    ]
+    assert tweets[0].author_username is tweets[1].author_username
+
+
+def test_derived_values_follow_model_copy_updates():
+    """Test that computed properties reflect fields changed through model_copy(update=...)."""
+    tweet = Tweet(tweet_id="1", author_username="test", content="x", created_at=datetime.now(), likes=1)
+    assert tweet.engagement_score == 1
+    assert tweet.model_copy(update={"likes": 100}).engagement_score == 100
+
+    summary = DailySummary(date=datetime(2026, 2, 3), key_insights=["first"])
+    assert summary.date_key == "2026-02-03"
+    updated = summary.model_copy(update={"date": datetime(2026, 2, 4), "key_insights": []})
+    assert updated.date_key == "2026-02-04"
+    assert updated.insights_text == "（无关键洞察）\n"
@@ -0,0 +1,71 @@
+"""Tests for the async rate limiter."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.scrapers import AsyncRateLimiter, rate_limiter
+
+_real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the limiter sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await _real_sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=fake.monotonic))
+    monkeypatch.setattr(asyncio, "sleep", fake.sleep)
+    return fake
+
+
+def _acquire_times(limiter: AsyncRateLimiter, clock: FakeClock, count: int) -> list[float]:
+    """Acquire the limiter `count` times concurrently and return the clock at each start."""
+
+    async def _run() -> list[float]:
+        times: list[float] = []
+
+        async def _request() -> None:
+            async with limiter:
+                times.append(clock.now)
+
+        await asyncio.gather(*(_request() for _ in range(count)))
+        return times
+
+    return asyncio.run(_run())
+
+
+def test_rate_limiter_spaces_requests(clock):
+    """Test that consecutive requests are `interval` apart."""
+    limiter = AsyncRateLimiter(capacity=10, interval=2.0, period=0.0)
+    assert _acquire_times(limiter, clock, 4) == [0.0, 2.0, 4.0, 6.0]
+
+
+def test_rate_limiter_enforces_capacity_per_period(clock):
+    """Test that at most `capacity` requests start within one period."""
+    limiter = AsyncRateLimiter(capacity=2, interval=0.0, period=10.0)
+    assert _acquire_times(limiter, clock, 3) == [0.0, 0.0, 10.0]
+    assert clock.sleeps == [10.0]
+
+
+def test_rate_limiter_pause_for(clock):
+    """Test that pause_for holds the next request until the pause ends."""
+    limiter = AsyncRateLimiter(capacity=10, interval=0.0, period=0.0)
+    clock.now = 100.0
+    limiter.pause_for(5.0)
+    assert _acquire_times(limiter, clock, 1) == [105.0]
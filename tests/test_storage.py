@@ -0,0 +1,299 @@
+"""Tests for the storage layer."""
+
+import asyncio
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+
+from src.models import Account, Tweet
+from src.storage import ACCOUNT_CACHE_SIZE, LLM_CACHE_MAX_AGE, Storage
+
+
+def test_get_account_cache_invalidated_on_write(tmp_path):
+    """Test that cached account lookups see accounts added or removed later."""
+
+    async def _run() -> None:
+        storage = Storage(str(tmp_path / "x.db"), str(tmp_path / "accounts.json"))
+        await storage.initialize()
+
+        assert await storage.get_account("alice") is None
+        assert await storage.add_account(Account(username="alice", user_id="1"))
+
+        account = await storage.get_account("alice")
+        assert account is not None and account.user_id == "1"
+
+        assert await storage.update_account_info("alice", "2", None, None)
+        assert (await storage.get_account("alice")).user_id == "2"
+
+        assert await storage.remove_account("alice")
+        assert await storage.get_account("alice") is None
+        await storage.close()
+
+    asyncio.run(_run())
+
+
+def test_get_last_tweet_ids_compares_numerically(tmp_path):
+    """Test that the newest tweet ID is picked numerically, not as text."""
+
+    async def _run() -> None:
+        storage = Storage(str(tmp_path / "x.db"), str(tmp_path / "accounts.json"))
+        await storage.initialize()
+
+        created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        await storage.save_tweets(
+            [
+                Tweet(tweet_id=tweet_id, author_username="alice", content="x", created_at=created_at)
+                for tweet_id in ("999", "1000")
+            ]
+        )
+
+        assert await storage.get_last_tweet_ids(["alice", "bob"]) == {"alice": "1000"}
+        await storage.close()
+
+    asyncio.run(_run())
+
+
+def test_add_accounts_skips_existing(tmp_path):
+    """Test batch account writes and that the account list sees later writes."""
+
+    async def _run() -> None:
+        storage = Storage(str(tmp_path / "x.db"), str(tmp_path / "accounts.json"))
+        await storage.initialize()
+
+        assert await storage.add_account(Account(username="alice"))
+        assert await storage.add_accounts(
+            [Account(username="alice"), Account(username="bob"), Account(username="bob")]
+        )
+        assert [a.username for a in await storage.get_accounts()] == ["alice", "bob"]
+        assert await storage.remove_account("alice")
+        assert [a.username for a in await storage.get_accounts()] == ["bob"]
+
+        assert await storage.update_accounts_info(
+            [Account(username="bob", user_id="2"), Account(username="carol", user_id="3")]
+        )
+        assert (await storage.get_account("bob")).user_id == "2"
+        await storage.close()
+
+    asyncio.run(_run())
+
+
+def test_initialize_migrates_iso_timestamps(tmp_path):
+    """Test that a version 0 database with ISO TEXT timestamps is migrated."""
+    db_path = tmp_path / "x.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(
+            """
+            CREATE TABLE tweets (
+                tweet_id TEXT PRIMARY KEY, author_username TEXT NOT NULL,
+                author_display_name TEXT, content TEXT, created_at TEXT NOT NULL,
+                likes INTEGER DEFAULT 0, retweets INTEGER DEFAULT 0, replies INTEGER DEFAULT 0,
+                views INTEGER, url TEXT, is_retweet BOOLEAN DEFAULT 0, is_reply BOOLEAN DEFAULT 0,
+                media_urls TEXT, fetched_at TEXT NOT NULL
+            );
+            CREATE INDEX idx_tweets_author ON tweets(author_username);
+            INSERT INTO tweets VALUES ('1', 'alice', NULL, 'hi', '2025-01-01T18:00:00+08:00',
+                1, 0, 0, NULL, '', 0, 1, '[]', '2025-01-02T00:00:00+00:00');
+            """
+        )
+
+    async def _run() -> None:
+        storage = Storage(str(db_path), str(tmp_path / "accounts.json"))
+        await storage.initialize()
+
+        tweets = await storage.get_tweets_since(datetime(2025, 1, 1, tzinfo=timezone.utc))
+        assert [t.tweet_id for t in tweets] == ["1"]
+        assert tweets[0].created_at == datetime(2025, 1, 1, 10, tzinfo=timezone.utc)
+        assert tweets[0].is_reply
+        await storage.close()
+
+    asyncio.run(_run())
+
+
+def test_initialize_migrates_local_summary_times(tmp_path, monkeypatch):
+    """Test that version 0 summary generation times (naive local time) keep their wall-clock time."""
+    db_path = tmp_path / "x.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(
+            """
+            CREATE TABLE tweets (
+                tweet_id TEXT PRIMARY KEY, author_username TEXT NOT NULL,
+                author_display_name TEXT, content TEXT, created_at TEXT NOT NULL,
+                likes INTEGER DEFAULT 0, retweets INTEGER DEFAULT 0, replies INTEGER DEFAULT 0,
+                views INTEGER, url TEXT, is_retweet BOOLEAN DEFAULT 0, is_reply BOOLEAN DEFAULT 0,
+                media_urls TEXT, fetched_at TEXT NOT NULL
+            );
+            CREATE TABLE summaries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, date TEXT NOT NULL UNIQUE,
+                accounts_monitored INTEGER, total_tweets INTEGER, summary_text TEXT,
+                analysis TEXT, key_insights TEXT, generated_at TEXT NOT NULL
+            );
+            CREATE INDEX idx_summaries_date ON summaries(date);
+            INSERT INTO summaries (date, accounts_monitored, total_tweets, summary_text, analysis,
+                key_insights, generated_at)
+            VALUES ('2026-02-09', 2, 5, 'text', 'analysis', '[]', '2026-02-09T08:00:00');
+            """
+        )
+
+    async def _run() -> None:
+        storage = Storage(str(db_path), str(tmp_path / "accounts.json"))
+        await storage.initialize()
+        summary = await storage.get_summary(datetime(2026, 2, 9))
+        await storage.close()
+
+        assert summary is not None
+        assert summary.generated_at == datetime(2026, 2, 9, 8).astimezone()
+        assert summary.generated_at_display.endswith("08:00:00")
+
+    # Run in a zone away from UTC, so reading the naive time as UTC would show
+    monkeypatch.setenv("TZ", "Asia/Shanghai")
+    time.tzset()
+    try:
+        asyncio.run(_run())
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+def test_initialize_migrates_epoch_seconds(tmp_path):
+    """Test that a version 1 database with REAL epoch seconds is migrated."""
+    db_path = tmp_path / "x.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(
+            """
+            CREATE TABLE tweets (
+                tweet_id TEXT PRIMARY KEY, author_username TEXT NOT NULL,
+                author_display_name TEXT, content TEXT, created_at REAL NOT NULL,
+                likes INTEGER DEFAULT 0, retweets INTEGER DEFAULT 0, replies INTEGER DEFAULT 0,
+                views INTEGER, url TEXT, is_retweet BOOLEAN DEFAULT 0, is_reply BOOLEAN DEFAULT 0,
+                media_urls TEXT, fetched_at TEXT NOT NULL
+            );
+            INSERT INTO tweets VALUES ('1', 'alice', NULL, 'hi', 1735725600.25,
+                1, 0, 0, NULL, '', 0, 0, '[]', '2025-01-02T00:00:00+00:00');
+            PRAGMA user_version = 1;
+            """
+        )
+
+    async def _run() -> None:
+        storage = Storage(str(db_path), str(tmp_path / "accounts.json"))
+        await storage.initialize()
+
+        tweets = await storage.get_tweets_since(datetime(2025, 1, 1, tzinfo=timezone.utc))
+        assert tweets[0].created_at == datetime(2025, 1, 1, 10, 0, 0, 250000, tzinfo=timezone.utc)
+        await storage.close()
+
+    asyncio.run(_run())
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT typeof(created_at), typeof(fetched_at) FROM tweets").fetchone() == (
+            "integer",
+            "integer",
+        )
+
+
+def test_concurrent_account_writes_are_not_lost(tmp_path):
+    """Test that overlapping config updates each see the previous write."""
+
+    async def _run() -> None:
+        storage = Storage(str(tmp_path / "x.db"), str(tmp_path / "accounts.json"))
+        await storage.initialize()
+
+        results = await asyncio.gather(
+            *(storage.add_account(Account(username=f"user{i}")) for i in range(5))
+        )
+        assert all(results)
+        assert {a.username for a in await storage.get_accounts()} == {f"user{i}" for i in range(5)}
+        await storage.close()
+
+    asyncio.run(_run())
+
+
+def test_naive_datetimes_are_treated_as_utc(tmp_path):
+    """Test that naive range bounds compare as UTC, not as local time."""
+
+    async def _run() -> None:
+        storage = Storage(str(tmp_path / "x.db"), str(tmp_path / "accounts.json"))
+        await storage.initialize()
+        await storage.save_tweets(
+            [
+                Tweet(
+                    tweet_id="1",
+                    author_username="alice",
+                    content="x",
+                    created_at=datetime(2025, 1, 1, 10, tzinfo=timezone.utc),
+                )
+            ]
+        )
+
+        day = await storage.get_tweets_between(datetime(2025, 1, 1), datetime(2025, 1, 1, 23, 59))
+        assert [t.tweet_id for t in day] == ["1"]
+        assert await storage.get_tweets_since(datetime(2025, 1, 1, 10, 0, 1)) == []
+        await storage.close()
+
+    asyncio.run(_run())
+
+
+def test_maintenance_prunes_expired_llm_cache(tmp_path):
+    """Test that maintenance drops LLM cache entries older than LLM_CACHE_MAX_AGE."""
+
+    async def _run() -> tuple[object, object]:
+        storage = Storage(str(tmp_path / "x.db"), str(tmp_path / "accounts.json"))
+        await storage.initialize()
+        try:
+            await storage.set_llm_cache("old", "old analysis", [])
+            await storage.set_llm_cache("new", "new analysis", ["insight"])
+            db = await storage._get_db()
+            await db.execute(
+                "UPDATE llm_cache SET created_at = ? WHERE key = 'old'",
+                ((datetime.now(timezone.utc) - LLM_CACHE_MAX_AGE - timedelta(hours=1)).isoformat(),),
+            )
+            await db.commit()
+
+            await storage.maintenance()
+            return await storage.get_llm_cache("old"), await storage.get_llm_cache("new")
+        finally:
+            await storage.close()
+
+    assert asyncio.run(_run()) == (None, ("new analysis", ["insight"]))
+
+
+def test_maintenance_task_is_opt_in_and_awaited_on_close(tmp_path):
+    """Test that initialize() starts no background task and close() awaits a started one."""
+
+    async def _run() -> None:
+        storage = Storage(str(tmp_path / "x.db"), str(tmp_path / "accounts.json"))
+        await storage.initialize()
+        assert storage._maintenance_task is None
+
+        storage.start_maintenance()
+        task = storage._maintenance_task
+        assert task is not None and not task.done()
+
+        await storage.close()
+        assert task.cancelled()
+        assert storage._maintenance_task is None
+
+    asyncio.run(_run())
+
+
+def test_account_cache_evicts_least_recently_used(tmp_path):
+    """Test that a cache hit keeps an account from being evicted first."""
+
+    async def _run() -> list[str]:
+        storage = Storage(str(tmp_path / "x.db"), str(tmp_path / "accounts.json"))
+        await storage.initialize()
+        try:
+            names = [f"user{i}" for i in range(ACCOUNT_CACHE_SIZE + 1)]
+            await storage.add_accounts([Account(username=name) for name in names])
+            for name in names[:ACCOUNT_CACHE_SIZE]:
+                await storage.get_account(name)
+            await storage.get_account(names[0])
+            await storage.get_account(names[-1])
+            return list(storage._account_cache)
+        finally:
+            await storage.close()
+
+    cached = asyncio.run(_run())
+    assert len(cached) == ACCOUNT_CACHE_SIZE
+    assert "user0" in cached
+    assert "user1" not in cached
+    assert cached[-2:] == ["user0", f"user{ACCOUNT_CACHE_SIZE}"]
@@ -0,0 +1,84 @@
+"""Tests for the Telegram notifier."""
+
+import asyncio
+from datetime import datetime, timezone
+
+from src.models import DailySummary
+from src.notifiers.telegram_notifier import TelegramNotifier, _split_message
+
+
+def test_split_message_on_line_boundaries():
+    """Test that long messages are split after newlines, within the limit."""
+    lines = [f"line {i} " + "x" * 20 for i in range(50)]
+    message = "\n".join(lines)
+
+    chunks = _split_message(message, limit=100)
+
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert all(chunk.endswith("\n") for chunk in chunks[:-1])
+    assert "".join(chunks) == message
+
+
+def test_split_message_long_line():
+    """Test that a line longer than the limit is split at the limit."""
+    chunks = _split_message("a" * 250 + "\nend", limit=100)
+    assert chunks == ["a" * 100, "a" * 100, "a" * 50 + "\nend"]
+
+
+def test_split_message_short_message():
+    """Test that a short message stays in one chunk."""
+    assert _split_message("hello\nworld") == ["hello\nworld"]
+
+
+def test_close_shuts_down_http_clients():
+    """Test that close() closes the notifier's own HTTP connection pools."""
+
+    async def _run() -> None:
+        first = TelegramNotifier("123:abc", "1")
+        second = TelegramNotifier("123:abc", "1")
+
+        await first.close()
+
+        assert all(request._client.is_closed for request in first._requests)
+        assert not any(request._client.is_closed for request in second._requests)
+        await second.close()
+
+    asyncio.run(_run())
+
+
+def test_send_summary_sends_chunks_in_order():
+    """Test that a long report is sent chunk by chunk, each send awaited in turn."""
+
+    class FakeBot:
+        def __init__(self) -> None:
+            self.sent: list[str] = []
+            self.in_flight = 0
+
+        async def send_message(self, chat_id: str, text: str) -> None:
+            assert self.in_flight == 0
+            self.in_flight += 1
+            await asyncio.sleep(0.01 if not self.sent else 0)
+            self.sent.append(text)
+            self.in_flight -= 1
+
+    summary = DailySummary(
+        date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        total_tweets=1,
+        accounts_monitored=1,
+        summary_text="summary",
+        analysis="\n".join(f"line {i} " + "x" * 50 for i in range(200)),
+    )
+
+    async def _run() -> None:
+        notifier = TelegramNotifier("123:abc", "1")
+        bot = FakeBot()
+        notifier.bot = bot
+
+        assert await notifier.send_summary(summary)
+
+        assert len(bot.sent) > 2
+        assert bot.sent[0].startswith("📊")
+        assert all(text.startswith(f"📄 (续 {i}/{len(bot.sent)})") for i, text in enumerate(bot.sent[1:], 2))
+        await notifier.close()
+
+    asyncio.run(_run())
@@ -0,0 +1,149 @@
+"""Tests for the X API scraper."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+import httpx
+import orjson
+import pytest
+
+from src.models import Account
+from src.scrapers.x_scraper import API_BASE_URL, XScraper
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+def _scraper(handler: Handler) -> XScraper:
+    """Build a scraper without pacing whose requests are served by `handler`."""
+    scraper = XScraper("token", rate_limit_delay=0.0, rate_limit_batch_delay=0.0)
+    scraper._client = httpx.AsyncClient(base_url=API_BASE_URL, transport=httpx.MockTransport(handler))
+    return scraper
+
+
+def _run(scraper: XScraper, coro_factory):
+    """Run a scraper call and close the scraper's client afterwards."""
+
+    async def _main():
+        try:
+            return await coro_factory()
+        finally:
+            await scraper.close()
+
+    return asyncio.run(_main())
+
+
+def _json(body: dict, status_code: int = 200, **headers: str) -> httpx.Response:
+    return httpx.Response(status_code, content=orjson.dumps(body), headers=headers)
+
+
+def test_get_recent_tweets_parses_response():
+    """Test that a 200 timeline response is turned into tweets with media URLs."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return _json({
+            "data": [{
+                "id": "2",
+                "text": "hello",
+                "created_at": "2025-01-01T10:00:00Z",
+                "public_metrics": {"like_count": 3},
+                "attachments": {"media_keys": ["m1"]},
+                "referenced_tweets": [{"type": "replied_to", "id": "1"}],
+            }],
+            "includes": {"media": [{"media_key": "m1", "url": "https://img/1.jpg"}]},
+        })
+
+    scraper = _scraper(handler)
+    since = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    tweets = _run(scraper, lambda: scraper.get_recent_tweets("alice", since, user_id="42", since_id="1"))
+
+    assert len(requests) == 1
+    assert requests[0].url.path == "/2/users/42/tweets"
+    assert requests[0].url.params["start_time"] == "2025-01-01T00:00:00Z"
+    assert requests[0].url.params["since_id"] == "1"
+    [tweet] = tweets
+    assert tweet.tweet_id == "2"
+    assert tweet.likes == 3
+    assert tweet.is_reply and not tweet.is_retweet
+    assert tweet.media_urls == ["https://img/1.jpg"]
+    assert tweet.created_at == datetime(2025, 1, 1, 10, tzinfo=timezone.utc)
+
+
+def test_request_retries_after_rate_limit():
+    """Test that a 429 is retried once the rate limit window resets."""
+    statuses = [429, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return _json({"data": {"id": "1"}}, statuses.pop(0), **{"x-rate-limit-reset": str(time.time())})
+
+    scraper = _scraper(handler)
+    body = _run(scraper, lambda: scraper._request("/users/by/username/alice"))
+
+    assert body == {"data": {"id": "1"}}
+    assert statuses == []
+
+
+def test_request_skips_server_errors():
+    """Test that a 5xx response skips the request instead of raising."""
+    scraper = _scraper(lambda request: httpx.Response(503))
+    assert _run(scraper, lambda: scraper._request("/users/by/username/alice")) is None
+
+
+def test_request_raises_client_errors():
+    """Test that a 4xx response (other than 429) raises."""
+    scraper = _scraper(lambda request: _json({"title": "Unauthorized"}, 401))
+    with pytest.raises(httpx.HTTPStatusError):
+        _run(scraper, lambda: scraper._request("/users/by/username/alice"))
+
+
+def test_get_users_info_maps_canonical_case():
+    """Test that users are keyed by the requested username and then cached."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return _json({"data": [
+            {"id": "1", "username": "Alice", "name": "Alice A"},
+            {"id": "2", "username": "bob"},
+            {"id": "3", "username": "mallory"},
+        ]})
+
+    scraper = _scraper(handler)
+
+    async def _lookups() -> tuple[dict[str, Account], dict[str, Account]]:
+        first = await scraper.get_users_info(["alice", "BOB", "carol"])
+        second = await scraper.get_users_info(["alice", "BOB"])
+        return first, second
+
+    first, second = _run(scraper, _lookups)
+
+    assert len(requests) == 1
+    assert requests[0].url.params["usernames"] == "alice,BOB,carol"
+    assert {name: account.user_id for name, account in first.items()} == {"alice": "1", "BOB": "2"}
+    assert first["alice"].display_name == "Alice A"
+    assert second == first
+
+
+def test_get_tweets_for_accounts_merges_newest_first():
+    """Test that per-account timelines are merged into one newest-first list."""
+    timelines = {
+        "1": ["2025-01-01T12:00:00Z", "2025-01-01T09:00:00Z"],
+        "2": ["2025-01-01T11:00:00Z", "2025-01-01T10:00:00Z", "2025-01-01T08:00:00Z"],
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        user_id = request.url.path.split("/")[3]
+        return _json({"data": [
+            {"id": f"{user_id}-{i}", "text": "t", "created_at": created_at}
+            for i, created_at in enumerate(timelines[user_id])
+        ]})
+
+    scraper = _scraper(handler)
+    accounts = [Account(username="alice", user_id="1"), Account(username="bob", user_id="2")]
+    tweets = _run(scraper, lambda: scraper.get_tweets_for_accounts(accounts))
+
+    assert [tweet.tweet_id for tweet in tweets] == ["1-0", "2-0", "2-1", "1-1", "2-2"]
+    assert [tweet.author_username for tweet in tweets] == ["alice", "bob", "bob", "alice", "bob"]